@@ -17,6 +17,16 @@ from pyfluff.dlc import DLCManager
 from pyfluff.furby import FurbyConnect
 from pyfluff.furby_cache import FurbyCache
 
+try:
+    # uvloop cuts per-task scheduling overhead, which adds up in the
+    # notification-heavy monitor and upload commands. The CLI works the
+    # same on the default loop when uvloop isn't installed (e.g. Windows).
+    import uvloop
+
+    uvloop.install()
+except ImportError:
+    pass
+
 app = typer.Typer(help="PyFluff - Control Furby Connect from the command line")
 console = Console()
 
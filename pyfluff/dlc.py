@@ -7,13 +7,76 @@ uploaded to Furby.
 
 import asyncio
 import logging
+from collections.abc import Awaitable, Callable
+from functools import cache
 from pathlib import Path
 
 from pyfluff.furby import FurbyConnect
-from pyfluff.protocol import FILE_CHUNK_SIZE, FileTransferMode, FurbyProtocol
+from pyfluff.protocol import (
+    FILE_CHUNK_SIZE,
+    FileTransferMode,
+    GeneralPlusResponse,
+    NordicCommand,
+    build_activate_dlc_command,
+    build_deactivate_dlc_command,
+    build_delete_dlc_command,
+    build_dlc_announce_command,
+    build_load_dlc_command,
+)
 
 logger = logging.getLogger(__name__)
 
+# Slot commands encode to constant byte strings, so they are memoized
+# rather than re-allocated per call.
+_build_announce = build_dlc_announce_command
+_build_load = cache(build_load_dlc_command)
+_build_activate = cache(build_activate_dlc_command)
+_build_deactivate = cache(build_deactivate_dlc_command)
+_build_delete = cache(build_delete_dlc_command)
+
+# Bound here so tests can patch just this module's pacing sleep without
+# touching the event loop's own asyncio.sleep.
+_sleep = asyncio.sleep
+
+# Single-byte prefixes matched with bytes.startswith, which avoids the
+# PyLong boxing that indexing data[0] does on every notification.
+_FILE_TRANSFER_PREFIX = bytes([GeneralPlusResponse.FILE_TRANSFER_MODE.value])
+_PACKET_ACK_PREFIX = bytes([NordicCommand.PACKET_ACK.value])
+
+# Read the DLC file in larger blocks and slice BLE-sized chunks out of them.
+# Must be a multiple of FILE_CHUNK_SIZE so only the final write is short.
+# ~64 KiB matches the filesystem readahead granularity, so a multi-megabyte
+# DLC costs tens of reads instead of thousands.
+READ_BLOCK_SIZE = FILE_CHUNK_SIZE * 3276
+
+# Number of unacknowledged file-write packets allowed in flight when Nordic
+# packet ACKs are enabled.
+WRITE_CREDITS = 8
+
+# Number of chunk writes issued concurrently per asyncio.gather call, so the
+# event loop hands several GATT writes to the BLE stack per scheduling pass.
+# The batch size adapts between 1 and MAX_WRITE_BATCH_SIZE based on how the
+# link behaves during the transfer.
+WRITE_BATCH_SIZE = 4
+MAX_WRITE_BATCH_SIZE = 8
+
+# Chunks per adaptive-tuning window.
+TUNE_WINDOW = 64
+
+# Fallback pacing between chunks when Nordic ACKs are unavailable.
+CHUNK_DELAY = 0.005
+
+# How long to wait for an ACK credit before sending anyway, so a missed
+# ACK can never stall the upload.
+CREDIT_TIMEOUT = 0.1
+
+# Minimum time between progress reports during an upload.
+PROGRESS_INTERVAL = 0.25
+
+# How long flash_and_activate waits for the delete confirmation before
+# proceeding with the upload anyway.
+DELETE_ACK_TIMEOUT = 2.0
+
 
 class DLCManager:
     """Manager for DLC file operations."""
@@ -30,121 +93,392 @@ class DLCManager:
         self._transfer_complete = asyncio.Event()
         self._transfer_error: str | None = None
 
+    def _on_ready_to_receive(self) -> None:
+        logger.info("File transfer status: READY_TO_RECEIVE")
+        self._transfer_ready.set()
+
+    def _on_file_received_ok(self) -> None:
+        logger.info("File transfer status: FILE_RECEIVED_OK")
+        self._transfer_complete.set()
+
+    def _on_file_received_error(self) -> None:
+        logger.info("File transfer status: FILE_RECEIVED_ERROR")
+        self._transfer_error = "File transfer failed"
+        self._transfer_complete.set()
+
+    def _on_file_transfer_timeout(self) -> None:
+        logger.info("File transfer status: FILE_TRANSFER_TIMEOUT")
+        self._transfer_error = "File transfer timeout"
+        self._transfer_complete.set()
+
+    # Dispatch table keyed on the raw mode byte. A dict lookup here is much
+    # cheaper than constructing a FileTransferMode enum (and catching
+    # ValueError for unknown values) per inbound notification.
+    _TRANSFER_DISPATCH: dict[int, Callable[["DLCManager"], None]] = {
+        FileTransferMode.READY_TO_RECEIVE.value: _on_ready_to_receive,
+        FileTransferMode.FILE_RECEIVED_OK.value: _on_file_received_ok,
+        FileTransferMode.FILE_RECEIVED_ERROR.value: _on_file_received_error,
+        FileTransferMode.FILE_TRANSFER_TIMEOUT.value: _on_file_transfer_timeout,
+    }
+
     def _file_transfer_callback(self, data: bytes) -> None:
         """Handle file transfer status notifications."""
-        if len(data) < 2 or data[0] != 0x24:
+        if len(data) < 2 or not data.startswith(_FILE_TRANSFER_PREFIX):
             return
 
-        try:
-            mode = FileTransferMode(data[1])
-            logger.info(f"File transfer status: {mode.name}")
-
-            if mode == FileTransferMode.READY_TO_RECEIVE:
-                self._transfer_ready.set()
-            elif mode == FileTransferMode.FILE_RECEIVED_OK:
-                self._transfer_complete.set()
-            elif mode == FileTransferMode.FILE_RECEIVED_ERROR:
-                self._transfer_error = "File transfer failed"
-                self._transfer_complete.set()
-            elif mode == FileTransferMode.FILE_TRANSFER_TIMEOUT:
-                self._transfer_error = "File transfer timeout"
-                self._transfer_complete.set()
-
-        except ValueError:
-            logger.warning(f"Unknown file transfer mode: {data[1]}")
+        handler = self._TRANSFER_DISPATCH.get(data[1])
+        if handler is not None:
+            handler(self)
+        else:
+            logger.debug(f"Ignoring file transfer mode: {data[1]}")
 
     async def upload_dlc(
-        self, dlc_path: Path, slot: int = 2, timeout: float = 60.0, enable_nordic_ack: bool = True
+        self,
+        source: Path | bytes,
+        slot: int = 2,
+        timeout: float = 60.0,
+        enable_nordic_ack: bool = True,
+        chunk_delay: float = CHUNK_DELAY,
+        chunk_size: int = FILE_CHUNK_SIZE,
+        progress_callback: Callable[[int, int], Awaitable[None]] | None = None,
     ) -> None:
         """
         Upload a DLC file to Furby.
 
         Args:
-            dlc_path: Path to DLC file
+            source: Path to a DLC file, or the DLC contents as bytes for
+                in-memory flashing without a disk round-trip
             slot: Slot number to upload to (default: 2)
             timeout: Upload timeout in seconds
             enable_nordic_ack: Enable Nordic packet ACK for monitoring (default: True)
+            chunk_delay: Fallback per-chunk pacing delay in seconds, used
+                only when Nordic ACK flow control is disabled
+            chunk_size: Bytes per GATT write (default: FILE_CHUNK_SIZE).
+                Firmware negotiating a larger MTU can coalesce several
+                packets per write to amortize the per-write overhead
+            progress_callback: Optional async callback receiving
+                (bytes_sent, file_size), invoked at most every
+                PROGRESS_INTERVAL seconds
 
         Raises:
             FileNotFoundError: If DLC file doesn't exist
             RuntimeError: If upload fails
         """
-        if not dlc_path.exists():
-            raise FileNotFoundError(f"DLC file not found: {dlc_path}")
+        await self.upload_many(
+            [(source, slot)],
+            timeout=timeout,
+            enable_nordic_ack=enable_nordic_ack,
+            chunk_delay=chunk_delay,
+            chunk_size=chunk_size,
+            progress_callback=progress_callback,
+        )
+
+    async def upload_many(
+        self,
+        uploads: list[tuple[Path | bytes, int]],
+        *,
+        timeout: float = 60.0,
+        enable_nordic_ack: bool = True,
+        chunk_delay: float = CHUNK_DELAY,
+        chunk_size: int = FILE_CHUNK_SIZE,
+        progress_callback: Callable[[int, int], Awaitable[None]] | None = None,
+    ) -> None:
+        """
+        Upload several DLC files back-to-back in one transfer context.
 
-        # Read DLC file
-        dlc_data = dlc_path.read_bytes()
-        file_size = len(dlc_data)
-        filename = dlc_path.name
+        The Nordic ACK setup and transfer callback are registered once and
+        shared across all files, so bulk provisioning skips the per-file
+        setup/teardown that separate upload_dlc calls would pay.
 
-        logger.info(f"Uploading DLC: {filename} ({file_size} bytes) to slot {slot}")
+        Args:
+            uploads: (source, slot) pairs, uploaded in order; each source is
+                a file path or in-memory DLC bytes
+            timeout: Per-file upload timeout in seconds
+            enable_nordic_ack: Enable Nordic packet ACK for monitoring (default: True)
+            chunk_delay: Fallback per-chunk pacing delay in seconds, used
+                only when Nordic ACK flow control is disabled
+            chunk_size: Bytes per GATT write (default: FILE_CHUNK_SIZE)
+            progress_callback: Optional async callback receiving
+                (bytes_sent, file_size) for the file currently uploading
 
-        # Enable Nordic Packet ACK for monitoring
+        Raises:
+            FileNotFoundError: If a DLC file doesn't exist
+            RuntimeError: If an upload fails
+        """
+        # Enable Nordic Packet ACK for monitoring and flow control. Each
+        # GotPacketAck returns one write credit, so chunks are paced by what
+        # Furby actually acknowledges instead of a fixed sleep.
+        credits: asyncio.Semaphore | None = None
+        ack_callback = None
         if enable_nordic_ack:
-            await self.furby.enable_nordic_packet_ack(True)
+            # The enabled flag lives on the connection and resets on
+            # disconnect, so a reconnect re-enables ACKs instead of
+            # silently uploading without flow control
+            if not self.furby._nordic_ack_enabled:
+                await self.furby.enable_nordic_packet_ack(True)
+            credits = asyncio.Semaphore(WRITE_CREDITS)
+            write_credits = credits
+
+            def ack_callback(data: bytes) -> None:
+                if data.startswith(_PACKET_ACK_PREFIX):
+                    write_credits.release()
+
+            self.furby.add_nordic_callback(ack_callback)
+
+        # Add transfer callback, filtered to file-transfer notifications
+        self.furby.add_gp_callback(
+            self._file_transfer_callback,
+            opcode=GeneralPlusResponse.FILE_TRANSFER_MODE.value,
+        )
+
+        try:
+            for source, slot in uploads:
+                await self._upload_one(
+                    source,
+                    slot,
+                    timeout=timeout,
+                    credits=credits,
+                    chunk_delay=chunk_delay,
+                    chunk_size=chunk_size,
+                    progress_callback=progress_callback,
+                )
+        finally:
+            # Remove callbacks
+            self.furby.remove_gp_callback(
+                self._file_transfer_callback,
+                opcode=GeneralPlusResponse.FILE_TRANSFER_MODE.value,
+            )
+            if ack_callback is not None:
+                self.furby.remove_nordic_callback(ack_callback)
+
+    async def _upload_one(
+        self,
+        source: Path | bytes,
+        slot: int,
+        *,
+        timeout: float,
+        credits: asyncio.Semaphore | None,
+        chunk_delay: float,
+        chunk_size: int,
+        progress_callback: Callable[[int, int], Awaitable[None]] | None,
+    ) -> None:
+        """Upload a single file; assumes callbacks and ACK are already set up."""
+        # Files are streamed chunk by chunk during upload; only the size is
+        # needed up front for the announce command. stat() raises
+        # FileNotFoundError itself, so no exists() preflight is needed.
+        if isinstance(source, bytes | bytearray | memoryview):
+            data: bytes | None = bytes(source)
+            file_size = len(data)
+            filename = "UPLOAD.DLC"
+        else:
+            data = None
+            file_size = source.stat().st_size
+            filename = source.name
+
+        logger.info(f"Uploading DLC: {filename} ({file_size} bytes) to slot {slot}")
 
         # Reset transfer state
         self._transfer_ready.clear()
         self._transfer_complete.clear()
         self._transfer_error = None
 
-        # Add transfer callback
-        self.furby.add_gp_callback(self._file_transfer_callback)
+        # Announce DLC upload
+        cmd = _build_announce(file_size, slot, filename)
+        await self.furby._write_gp(cmd)
 
+        # Wait for the ready signal, but also watch the complete event so
+        # an error posted before READY_TO_RECEIVE fails immediately
+        # instead of burning the whole ready timeout.
+        ready_task = asyncio.ensure_future(self._transfer_ready.wait())
+        complete_task = asyncio.ensure_future(self._transfer_complete.wait())
         try:
-            # Announce DLC upload
-            cmd = FurbyProtocol.build_dlc_announce_command(file_size, slot, filename)
-            await self.furby._write_gp(cmd)
-
-            # Wait for ready signal
+            done, _ = await asyncio.wait(
+                {ready_task, complete_task},
+                timeout=10.0,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+        finally:
+            ready_task.cancel()
+            complete_task.cancel()
+        if complete_task in done and self._transfer_error is not None:
+            raise RuntimeError(f"DLC upload failed: {self._transfer_error}")
+        if ready_task not in done:
+            raise RuntimeError("Furby did not respond to DLC upload announcement")
+
+        # Stream file in chunks so only one chunk is resident at a time
+        logger.info("Furby ready, uploading data...")
+        offset = 0
+        chunk_count = 0
+        loop = asyncio.get_running_loop()
+        next_report = loop.time() + PROGRESS_INTERVAL
+        batch_size = WRITE_BATCH_SIZE
+        window_chunks = 0
+        window_stalls = 0
+
+        # Read blocks sized as a multiple of chunk_size so only the
+        # final write is short
+        read_block_size = chunk_size * (READ_BLOCK_SIZE // FILE_CHUNK_SIZE)
+
+        # Read ahead on a separate task so disk I/O overlaps with BLE
+        # writes; the bounded queue caps read-ahead at two blocks.
+        # In-memory sources skip the file I/O entirely.
+        read_queue: asyncio.Queue[bytes | memoryview | None] = asyncio.Queue(maxsize=2)
+
+        async def read_blocks() -> None:
             try:
-                await asyncio.wait_for(
-                    self._transfer_ready.wait(), timeout=10.0
-                )
-            except TimeoutError:
-                raise RuntimeError(
-                    "Furby did not respond to DLC upload announcement"
-                ) from None
+                if data is not None:
+                    view = memoryview(data)
+                    for off in range(0, file_size, read_block_size):
+                        await read_queue.put(view[off : off + read_block_size])
+                else:
+                    # Plain blocking reads dispatched to a worker thread;
+                    # each to_thread call covers a whole block, so the
+                    # per-call overhead is amortized over many chunks
+                    f = await asyncio.to_thread(open, source, "rb")
+                    try:
+                        while block := await asyncio.to_thread(f.read, read_block_size):
+                            await read_queue.put(block)
+                    finally:
+                        f.close()
+            finally:
+                await read_queue.put(None)
+
+        reader = asyncio.create_task(read_blocks())
+        try:
+            while (block := await read_queue.get()) is not None:
+                # Slicing a memoryview is zero-copy, unlike slicing bytes
+                view = memoryview(block)
+                block_len = len(block)
+                block_offset = 0
+                while block_offset < block_len:
+                    batch_step = chunk_size * batch_size
+                    batch = [
+                        view[o : o + chunk_size]
+                        for o in range(
+                            block_offset,
+                            min(block_offset + batch_step, block_len),
+                            chunk_size,
+                        )
+                    ]
+                    block_offset += batch_step
+
+                    if credits is not None:
+                        # Back-pressure: one packet ACK credit per chunk,
+                        # but never stall forever on a dropped ACK
+                        for _ in batch:
+                            try:
+                                async with asyncio.timeout(CREDIT_TIMEOUT):
+                                    await credits.acquire()
+                            except TimeoutError:
+                                window_stalls += 1
+                    else:
+                        # Fixed-rate pacing to avoid overwhelming Furby
+                        await _sleep(chunk_delay * len(batch))
+
+                    # Pipeline the batch so the BLE stack receives several
+                    # writes per event-loop pass
+                    await asyncio.gather(
+                        *(self.furby._write_file(chunk) for chunk in batch)
+                    )
+                    offset += sum(len(chunk) for chunk in batch)
+                    chunk_count += len(batch)
+
+                    # Adaptive batching: if a whole window of chunks got
+                    # credits without stalling, Furby is keeping up, so
+                    # push more writes per pass; repeated stalls mean the
+                    # link is saturated, so back off
+                    if credits is not None:
+                        window_chunks += len(batch)
+                        if window_chunks >= TUNE_WINDOW:
+                            if window_stalls == 0 and batch_size < MAX_WRITE_BATCH_SIZE:
+                                batch_size *= 2
+                            elif window_stalls > 4 and batch_size > 1:
+                                batch_size //= 2
+                            window_chunks = 0
+                            window_stalls = 0
+
+                    # Time-throttled progress: report at most every
+                    # PROGRESS_INTERVAL regardless of chunk rate
+                    now = loop.time()
+                    if now >= next_report:
+                        next_report = now + PROGRESS_INTERVAL
+                        progress = (offset / file_size) * 100
+                        logger.info(f"Upload progress: {progress:.1f}%")
+                        if progress_callback is not None:
+                            await progress_callback(offset, file_size)
+
+            # Surface any read error from the producer task
+            await reader
+        finally:
+            if not reader.done():
+                reader.cancel()
 
-            # Upload file in chunks
-            logger.info("Furby ready, uploading data...")
-            offset = 0
-            chunk_count = 0
+        logger.info(f"Uploaded {chunk_count} chunks, waiting for confirmation...")
 
-            while offset < file_size:
-                chunk = dlc_data[offset : offset + FILE_CHUNK_SIZE]
-                await self.furby._write_file(chunk)
-                offset += len(chunk)
-                chunk_count += 1
+        # Wait for transfer complete
+        try:
+            async with asyncio.timeout(timeout):
+                await self._transfer_complete.wait()
+        except TimeoutError:
+            raise RuntimeError("Timeout waiting for upload confirmation") from None
+
+        # Check for errors
+        if self._transfer_error:
+            raise RuntimeError(self._transfer_error)
+
+        logger.info("DLC upload complete!")
+        if progress_callback is not None:
+            await progress_callback(file_size, file_size)
+
+    async def flash_and_activate(
+        self,
+        dlc_path: Path,
+        slot: int = 2,
+        timeout: float = 60.0,
+        progress_callback: Callable[[int, int], Awaitable[None]] | None = None,
+    ) -> None:
+        """
+        Delete, upload, load, and activate a DLC in one pipeline.
 
-                # Small delay to prevent overwhelming Furby
-                await asyncio.sleep(0.005)
+        Stage transitions are driven by Furby's own status notifications
+        where available (with a short fallback timeout) rather than fixed
+        sleeps, so the happy path proceeds as soon as Furby is ready.
 
-                # Progress logging
-                if chunk_count % 100 == 0:
-                    progress = (offset / file_size) * 100
-                    logger.info(f"Upload progress: {progress:.1f}%")
+        Args:
+            dlc_path: Path to DLC file
+            slot: Slot number to flash (default: 2)
+            timeout: Upload timeout in seconds
+            progress_callback: Optional async callback, see upload_dlc
+        """
+        deleted = asyncio.Event()
 
-            logger.info(f"Uploaded {chunk_count} chunks, waiting for confirmation...")
+        def delete_ack(data: bytes) -> None:
+            if len(data) > 0 and data[0] == GeneralPlusResponse.GOT_DELETE_SLOT_BY_INDEX.value:
+                deleted.set()
 
-            # Wait for transfer complete
+        # Clear the slot first; wait for the delete confirmation instead of
+        # sleeping a fixed delay, with a fallback if it never arrives
+        self.furby.add_gp_callback(
+            delete_ack, opcode=GeneralPlusResponse.GOT_DELETE_SLOT_BY_INDEX.value
+        )
+        try:
+            await self.delete_dlc(slot)
             try:
-                await asyncio.wait_for(
-                    self._transfer_complete.wait(), timeout=timeout
-                )
+                async with asyncio.timeout(DELETE_ACK_TIMEOUT):
+                    await deleted.wait()
             except TimeoutError:
-                raise RuntimeError("Timeout waiting for upload confirmation") from None
-
-            # Check for errors
-            if self._transfer_error:
-                raise RuntimeError(self._transfer_error)
-
-            logger.info("DLC upload complete!")
-
+                logger.debug("No delete confirmation, continuing anyway")
         finally:
-            # Remove callback
-            if self._file_transfer_callback in self.furby._gp_callbacks:
-                self.furby._gp_callbacks.remove(self._file_transfer_callback)
+            self.furby.remove_gp_callback(
+                delete_ack, opcode=GeneralPlusResponse.GOT_DELETE_SLOT_BY_INDEX.value
+            )
+
+        await self.upload_dlc(
+            dlc_path, slot, timeout=timeout, progress_callback=progress_callback
+        )
+        await self.load_dlc(slot)
+        await self.activate_dlc()
+        logger.info(f"Flashed and activated {dlc_path.name} in slot {slot}")
 
     async def load_dlc(self, slot: int) -> None:
         """
@@ -153,13 +487,13 @@ class DLCManager:
         Args:
             slot: Slot number to load
         """
-        cmd = FurbyProtocol.build_load_dlc_command(slot)
+        cmd = _build_load(slot)
         await self.furby._write_gp(cmd)
         logger.info(f"Loaded DLC from slot {slot}")
 
     async def activate_dlc(self) -> None:
         """Activate the currently loaded DLC."""
-        cmd = FurbyProtocol.build_activate_dlc_command()
+        cmd = _build_activate()
         await self.furby._write_gp(cmd)
         logger.info("Activated DLC")
 
@@ -170,7 +504,7 @@ class DLCManager:
         Args:
             slot: Slot number to deactivate
         """
-        cmd = FurbyProtocol.build_deactivate_dlc_command(slot)
+        cmd = _build_deactivate(slot)
         await self.furby._write_gp(cmd)
         logger.info(f"Deactivated DLC in slot {slot}")
 
@@ -181,6 +515,6 @@ class DLCManager:
         Args:
             slot: Slot number to delete
         """
-        cmd = FurbyProtocol.build_delete_dlc_command(slot)
+        cmd = _build_delete(slot)
         await self.furby._write_gp(cmd)
         logger.info(f"Deleted DLC from slot {slot}")
@@ -50,8 +50,19 @@ class FurbyConnect:
         self.client: BleakClient | None = None
         self._connected = False
         self._idle_task: asyncio.Task[None] | None = None
-        self._gp_callbacks: list[Callable[[bytes], None]] = []
+        # GeneralPlus callbacks are indexed by the response opcode they care
+        # about (first byte of the notification); None subscribes to all.
+        # During an upload the ACK storm hits this dispatch per packet, so a
+        # dict lookup beats running every callback against every packet.
+        self._gp_callbacks: dict[int | None, list[Callable[[bytes], None]]] = {}
         self._nordic_callbacks: list[Callable[[bytes], None]] = []
+        # Device info is static per connection; the shared task caches it
+        # and coalesces concurrent first readers onto one set of GATT reads.
+        self._info_task: asyncio.Task[FurbyInfo] | None = None
+        # Whether Nordic packet ACKs are currently on for this connection,
+        # so back-to-back DLC uploads skip the redundant BLE round-trip.
+        # Furby loses the setting on disconnect, so it resets with the link.
+        self._nordic_ack_enabled = False
 
     @property
     def connected(self) -> bool:
@@ -85,14 +96,16 @@ class FurbyConnect:
         furbies = [d for d in devices if d.name and FURBY_NAME in d.name]
         logger.info(f"Found {len(furbies)} Furby device(s)")
 
-        # Update cache with discovered Furbies
+        # Update cache with discovered Furbies; one coalesced write for
+        # the whole scan instead of one per device
         if cache is not None:
-            for device in furbies:
-                cache.add_or_update(
-                    address=device.address,
-                    device_name=device.name
-                )
-                logger.debug(f"Updated cache for {device.address}")
+            with cache:
+                for device in furbies:
+                    cache.add_or_update(
+                        address=device.address,
+                        device_name=device.name
+                    )
+                    logger.debug(f"Updated cache for {device.address}")
 
         if len(furbies) == 0:
             logger.warning("No Furbies found. They may be in F2F mode. Try:")
@@ -224,6 +237,8 @@ class FurbyConnect:
             await self.client.disconnect()
 
         self._connected = False
+        self._info_task = None
+        self._nordic_ack_enabled = False
         logger.info("Disconnected")
 
     async def _subscribe_notifications(self) -> None:
@@ -255,11 +270,17 @@ class FurbyConnect:
     def _gp_notification_handler(self, sender: int, data: bytes) -> None:
         """Handle notifications from GeneralPlus characteristic."""
         logger.debug(f"GP notification: {data.hex()}")
-        for callback in self._gp_callbacks:
+        for callback in self._gp_callbacks.get(None, ()):
             try:
                 callback(data)
             except Exception as e:
                 logger.error(f"Error in GP callback: {e}")
+        if data:
+            for callback in self._gp_callbacks.get(data[0], ()):
+                try:
+                    callback(data)
+                except Exception as e:
+                    logger.error(f"Error in GP callback: {e}")
 
     def _nordic_notification_handler(self, sender: int, data: bytes) -> None:
         """Handle notifications from Nordic characteristic."""
@@ -274,14 +295,39 @@ class FurbyConnect:
         """Handle RSSI notifications."""
         logger.debug(f"RSSI notification: {data.hex()}")
 
-    def add_gp_callback(self, callback: Callable[[bytes], None]) -> None:
-        """Add callback for GeneralPlus notifications."""
-        self._gp_callbacks.append(callback)
+    def add_gp_callback(
+        self, callback: Callable[[bytes], None], opcode: int | None = None
+    ) -> None:
+        """
+        Add callback for GeneralPlus notifications.
+
+        Args:
+            callback: Called with the raw notification payload
+            opcode: Optional response opcode filter; when set, the callback
+                only runs for notifications starting with that byte
+        """
+        self._gp_callbacks.setdefault(opcode, []).append(callback)
 
     def add_nordic_callback(self, callback: Callable[[bytes], None]) -> None:
         """Add callback for Nordic notifications."""
         self._nordic_callbacks.append(callback)
 
+    def remove_gp_callback(
+        self, callback: Callable[[bytes], None], opcode: int | None = None
+    ) -> None:
+        """Remove a GeneralPlus callback; no-op if not registered."""
+        try:
+            self._gp_callbacks.get(opcode, []).remove(callback)
+        except ValueError:
+            pass
+
+    def remove_nordic_callback(self, callback: Callable[[bytes], None]) -> None:
+        """Remove a Nordic callback; no-op if not registered."""
+        try:
+            self._nordic_callbacks.remove(callback)
+        except ValueError:
+            pass
+
     def _start_idle(self) -> None:
         """Start idle keepalive task to prevent Furby from talking."""
         if self._idle_task is None or self._idle_task.done():
@@ -337,9 +383,10 @@ class FurbyConnect:
         """
         cmd = FurbyProtocol.build_nordic_packet_ack(enabled)
         await self._write_nordic(cmd)
+        self._nordic_ack_enabled = enabled
         logger.info(f"Nordic packet ACK {'enabled' if enabled else 'disabled'}")
 
-    async def _write_file(self, data: bytes) -> None:
+    async def _write_file(self, data: bytes | memoryview) -> None:
         """Write data to File characteristic."""
         if not self.client or not self.connected:
             raise RuntimeError("Not connected to Furby")
@@ -426,55 +473,59 @@ class FurbyConnect:
         await self._write_gp(cmd)
         logger.info(f"Set mood {mood_type.name} to {value} (absolute={set_absolute})")
 
+    # Device-information characteristics read by get_device_info, paired
+    # with the FurbyInfo field each one populates.
+    _INFO_CHARACTERISTICS: tuple[tuple[str, str], ...] = (
+        ("manufacturer", FurbyCharacteristic.MANUFACTURER_NAME),
+        ("model_number", FurbyCharacteristic.MODEL_NUMBER),
+        ("serial_number", FurbyCharacteristic.SERIAL_NUMBER),
+        ("hardware_revision", FurbyCharacteristic.HARDWARE_REVISION),
+        ("firmware_revision", FurbyCharacteristic.FIRMWARE_REVISION),
+        ("software_revision", FurbyCharacteristic.SOFTWARE_REVISION),
+    )
+
     async def get_device_info(self) -> FurbyInfo:
         """
         Get device information from Furby.
 
+        The six characteristic reads are issued concurrently, and a fully
+        successful result is cached for the lifetime of the connection,
+        so repeated or concurrent callers share a single set of BLE
+        round-trips. If any read fails the partial result is returned but
+        not cached, so the flaky characteristics are retried next call.
+
         Returns:
             FurbyInfo with device details
         """
         if not self.client or not self.connected:
             raise RuntimeError("Not connected to Furby")
 
-        info = FurbyInfo()
-
-        # Read device information characteristics
-        try:
-            data = await self.client.read_gatt_char(FurbyCharacteristic.MANUFACTURER_NAME)
-            info.manufacturer = data.decode("utf-8").strip("\x00")
-        except Exception as e:
-            logger.warning(f"Could not read manufacturer: {e}")
-
-        try:
-            data = await self.client.read_gatt_char(FurbyCharacteristic.MODEL_NUMBER)
-            info.model_number = data.decode("utf-8").strip("\x00")
-        except Exception as e:
-            logger.warning(f"Could not read model number: {e}")
-
-        try:
-            data = await self.client.read_gatt_char(FurbyCharacteristic.SERIAL_NUMBER)
-            info.serial_number = data.decode("utf-8").strip("\x00")
-        except Exception as e:
-            logger.warning(f"Could not read serial number: {e}")
-
-        try:
-            data = await self.client.read_gatt_char(FurbyCharacteristic.HARDWARE_REVISION)
-            info.hardware_revision = data.decode("utf-8").strip("\x00")
-        except Exception as e:
-            logger.warning(f"Could not read hardware revision: {e}")
-
-        try:
-            data = await self.client.read_gatt_char(FurbyCharacteristic.FIRMWARE_REVISION)
-            info.firmware_revision = data.decode("utf-8").strip("\x00")
-        except Exception as e:
-            logger.warning(f"Could not read firmware revision: {e}")
-
-        try:
-            data = await self.client.read_gatt_char(FurbyCharacteristic.SOFTWARE_REVISION)
-            info.software_revision = data.decode("utf-8").strip("\x00")
-        except Exception as e:
-            logger.warning(f"Could not read software revision: {e}")
+        if self._info_task is None:
+            self._info_task = asyncio.create_task(self._read_device_info())
+        return await self._info_task
 
+    async def _read_device_info(self) -> FurbyInfo:
+        """Read all device-information characteristics in parallel."""
+        assert self.client is not None
+        info = FurbyInfo()
+        results = await asyncio.gather(
+            *(self.client.read_gatt_char(uuid) for _, uuid in self._INFO_CHARACTERISTICS),
+            return_exceptions=True,
+        )
+        complete = True
+        for (field, _), data in zip(self._INFO_CHARACTERISTICS, results, strict=True):
+            if isinstance(data, BaseException):
+                logger.warning(f"Could not read {field}: {data}")
+                complete = False
+            else:
+                # The values are null-terminated; split stops at the first
+                # null in one pass instead of strip scanning both ends
+                setattr(info, field, bytes(data).split(b"\x00", 1)[0].decode("utf-8", "replace"))
+        if not complete:
+            # These reads flake on real links; drop the task so the failed
+            # characteristics are retried on the next call instead of
+            # pinning empty fields until disconnect
+            self._info_task = None
         return info
 
     async def sensor_stream(self) -> AsyncIterator[SensorData]:
@@ -492,14 +543,18 @@ class FurbyConnect:
             if len(data) > 0 and data[0] == GeneralPlusResponse.SENSOR_STATUS.value:
                 queue.put_nowait(data)
 
-        self.add_gp_callback(sensor_callback)
+        self.add_gp_callback(
+            sensor_callback, opcode=GeneralPlusResponse.SENSOR_STATUS.value
+        )
 
         try:
             while True:
                 data = await queue.get()
                 yield SensorData(timestamp=time.time(), raw_data=data.hex())
         finally:
-            self._gp_callbacks.remove(sensor_callback)
+            self.remove_gp_callback(
+                sensor_callback, opcode=GeneralPlusResponse.SENSOR_STATUS.value
+            )
 
     async def __aenter__(self) -> "FurbyConnect":
         """Async context manager entry."""
@@ -9,13 +9,27 @@ access to known devices even when they're in F2F mode.
 
 import json
 import logging
+import os
+import sys
 import time
+from collections.abc import Callable
 from pathlib import Path
 
+# orjson serializes several times faster than stdlib json and emits bytes
+# directly; fall back to stdlib when it isn't installed.
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 from pyfluff.models import KnownFurbiesConfig, KnownFurby
 
 logger = logging.getLogger(__name__)
 
+# A device re-seen with no new fields only refreshes last_seen; rewriting the
+# file that often is wasted I/O, so such refreshes persist at most this often.
+LAST_SEEN_SAVE_INTERVAL = 5.0
+
 
 class FurbyCache:
     """
@@ -28,15 +42,41 @@ class FurbyCache:
     - Firmware versions (when available)
     """
 
-    def __init__(self, cache_file: Path | str = "known_furbies.json") -> None:
+    def __init__(
+        self,
+        cache_file: Path | str = "known_furbies.json",
+        clock: Callable[[], float] = time.time,
+    ) -> None:
         """
         Initialize the Furby cache.
         
         Args:
             cache_file: Path to the cache file (default: known_furbies.json)
+            clock: Timestamp source for last_seen; injectable for
+                deterministic tests (default: time.time)
         """
         self.cache_file = Path(cache_file)
+        self._clock = clock
+        # Batching state: inside a `with cache:` block saves are deferred
+        # and coalesced into one write at exit.
+        self._defer_depth = 0
+        self._dirty = False
+        # Memoized recency ordering; invalidated on any mutation so
+        # get_all/get_most_recent only re-sort when something changed.
+        self._sorted: list[KnownFurby] | None = None
         self.config = self._load()
+        # Per-entry dumps kept in lockstep with config.furbies, so saving
+        # serializes a prebuilt dict instead of re-walking every Pydantic
+        # model for each write
+        self._dumped: dict[str, dict] = {
+            addr: furby.model_dump() for addr, furby in self.config.furbies.items()
+        }
+        # last_seen values as last persisted, per address. The re-seen
+        # skip path throttles against these, so refreshes still reach
+        # disk once per LAST_SEEN_SAVE_INTERVAL instead of never.
+        self._saved_last_seen: dict[str, float] = {
+            addr: entry["last_seen"] for addr, entry in self._dumped.items()
+        }
 
     def _load(self) -> KnownFurbiesConfig:
         """Load cache from disk."""
@@ -45,26 +85,73 @@ class FurbyCache:
             return KnownFurbiesConfig(furbies={})
 
         try:
-            with open(self.cache_file) as f:
-                data = json.load(f)
-                config = KnownFurbiesConfig(**data)
-                logger.info(f"Loaded {len(config.furbies)} known Furbies from cache")
-                return config
+            raw = self.cache_file.read_bytes()
+            data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+            # The file came from our own _save(), so skip Pydantic
+            # validation; external input still validates in add_or_update.
+            # Interning the address unifies the dict key and the entry's
+            # address attribute into one string object, so lookups compare
+            # by identity first.
+            furbies = {}
+            for addr, entry in data.get("furbies", {}).items():
+                addr = sys.intern(addr)
+                entry["address"] = addr
+                furbies[addr] = KnownFurby.model_construct(**entry)
+            config = KnownFurbiesConfig.model_construct(furbies=furbies)
+            logger.info(f"Loaded {len(config.furbies)} known Furbies from cache")
+            return config
         except Exception as e:
             logger.error(f"Failed to load cache file: {e}")
             logger.warning("Starting with empty cache")
             return KnownFurbiesConfig(furbies={})
 
     def _save(self) -> None:
-        """Save cache to disk."""
+        """Save cache to disk, or mark it dirty inside a batching block."""
+        if self._defer_depth:
+            self._dirty = True
+            return
+        self._dirty = False
+        self._write()
+
+    def _write(self) -> None:
+        """Serialize and write the cache file."""
         try:
             self.cache_file.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.cache_file, "w") as f:
-                json.dump(self.config.model_dump(), f, indent=2)
+            data = {"furbies": self._dumped}
+            # Compact JSON: indentation was a quarter of the file's bytes
+            # and the CLI renders the cache as a table anyway
+            if orjson is not None:
+                buf = orjson.dumps(data)
+            else:
+                buf = json.dumps(data, separators=(",", ":")).encode()
+            # Write to a temp file and atomically swap it in, so a crash
+            # mid-write can never leave a truncated cache at the real path
+            tmp = self.cache_file.with_suffix(self.cache_file.suffix + ".tmp")
+            tmp.write_bytes(buf)
+            os.replace(tmp, self.cache_file)
+            self._saved_last_seen = {
+                addr: entry["last_seen"] for addr, entry in self._dumped.items()
+            }
             logger.debug(f"Saved cache with {len(self.config.furbies)} Furbies")
         except Exception as e:
             logger.error(f"Failed to save cache file: {e}")
 
+    def flush(self) -> None:
+        """Write any deferred changes to disk."""
+        if self._dirty:
+            self._dirty = False
+            self._write()
+
+    def __enter__(self) -> "FurbyCache":
+        """Start a batch: mutations inside the block coalesce into one write."""
+        self._defer_depth += 1
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._defer_depth -= 1
+        if self._defer_depth == 0:
+            self.flush()
+
     def add_or_update(
         self,
         address: str,
@@ -86,29 +173,49 @@ class FurbyCache:
         Returns:
             The updated KnownFurby entry
         """
+        # Interned keys make repeated dict lookups identity comparisons
+        # instead of re-hashing the 17-byte address string every call
+        address = sys.intern(address)
+
+        # Only the provided fields are applied, in one pass
+        updates = {
+            key: value
+            for key, value in (
+                ("device_name", device_name),
+                ("name", name),
+                ("name_id", name_id),
+                ("firmware_revision", firmware_revision),
+            )
+            if value is not None
+        }
+
         # Get existing entry or create new one
         if address in self.config.furbies:
             furby = self.config.furbies[address]
+            now = self._clock()
+            changed = any(getattr(furby, key) != value for key, value in updates.items())
+            saved = self._saved_last_seen.get(address, 0.0)
+            if not changed and now - saved < LAST_SEEN_SAVE_INTERVAL:
+                # Re-seen with nothing new since the last persisted
+                # timestamp: refresh in memory and mark dirty so flush()
+                # still picks it up, but skip the immediate write
+                furby.last_seen = now
+                self._dumped[address]["last_seen"] = now
+                self._sorted = None
+                self._dirty = True
+                return furby
+            for key, value in updates.items():
+                setattr(furby, key, value)
+            furby.last_seen = now
             logger.debug(f"Updating existing Furby: {address}")
         else:
-            furby = KnownFurby(address=address, last_seen=time.time())
+            furby = KnownFurby(address=address, last_seen=self._clock(), **updates)
             logger.info(f"Adding new Furby to cache: {address}")
 
-        # Update fields (only if new values provided)
-        if device_name is not None:
-            furby.device_name = device_name
-        if name is not None:
-            furby.name = name
-        if name_id is not None:
-            furby.name_id = name_id
-        if firmware_revision is not None:
-            furby.firmware_revision = firmware_revision
-
-        # Always update last_seen
-        furby.last_seen = time.time()
-
         # Save to cache
         self.config.furbies[address] = furby
+        self._dumped[address] = furby.model_dump()
+        self._sorted = None
         self._save()
 
         return furby
@@ -132,9 +239,11 @@ class FurbyCache:
         Returns:
             List of all KnownFurby entries, sorted by last_seen (newest first)
         """
-        furbies = list(self.config.furbies.values())
-        furbies.sort(key=lambda f: f.last_seen, reverse=True)
-        return furbies
+        if self._sorted is None:
+            self._sorted = sorted(
+                self.config.furbies.values(), key=lambda f: f.last_seen, reverse=True
+            )
+        return list(self._sorted)
 
     def remove(self, address: str) -> bool:
         """
@@ -148,6 +257,8 @@ class FurbyCache:
         """
         if address in self.config.furbies:
             del self.config.furbies[address]
+            self._dumped.pop(address, None)
+            self._sorted = None
             self._save()
             logger.info(f"Removed Furby from cache: {address}")
             return True
@@ -157,6 +268,8 @@ class FurbyCache:
         """Clear all entries from the cache."""
         count = len(self.config.furbies)
         self.config.furbies.clear()
+        self._dumped.clear()
+        self._sorted = None
         self._save()
         logger.info(f"Cleared cache ({count} entries removed)")
 
@@ -167,7 +280,7 @@ class FurbyCache:
         Returns:
             List of MAC addresses
         """
-        return list(self.config.furbies.keys())
+        return list(self.config.furbies)
 
     def update_name(self, address: str, name: str, name_id: int) -> None:
         """
@@ -181,7 +294,9 @@ class FurbyCache:
         if address in self.config.furbies:
             self.config.furbies[address].name = name
             self.config.furbies[address].name_id = name_id
-            self.config.furbies[address].last_seen = time.time()
+            self.config.furbies[address].last_seen = self._clock()
+            self._dumped[address] = self.config.furbies[address].model_dump()
+            self._sorted = None
             self._save()
             logger.info(f"Updated name for {address}: {name} (ID: {name_id})")
         else:
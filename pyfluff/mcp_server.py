@@ -7,28 +7,141 @@ other AI assistants supporting the MCP protocol.
 """
 
 import logging
-from typing import Any
-
-from mcp.server.fastmcp import FastMCP
+from typing import TYPE_CHECKING, Any
 
 from pyfluff.furby import FurbyConnect
 from pyfluff.protocol import MoodMeterType
 
+if TYPE_CHECKING:
+    from mcp.server.fastmcp import FastMCP
+
 logger = logging.getLogger(__name__)
 
 # Global Furby connection instance
 _furby: FurbyConnect | None = None
 
-# Create MCP server
-mcp = FastMCP(
-    name="PyFluff Furby Controller",
-    instructions=(
-        "Control Furby Connect toys via Bluetooth. "
-        "First discover or connect to a Furby, then use the control tools. "
-        "Available actions include changing antenna color, triggering actions, "
-        "adjusting mood, and more."
+# Mood type names accepted by set_mood, built once instead of per call
+_MOOD_MAP: dict[str, MoodMeterType] = {
+    "excitedness": MoodMeterType.EXCITEDNESS,
+    "displeasedness": MoodMeterType.DISPLEASEDNESS,
+    "tiredness": MoodMeterType.TIREDNESS,
+    "fullness": MoodMeterType.FULLNESS,
+    "wellness": MoodMeterType.WELLNESS,
+}
+_MOOD_KEYS = ", ".join(_MOOD_MAP)
+
+# Prebuilt responses for common precondition failures. Callers treat tool
+# results as read-only, so the same dict can be returned every time.
+_NOT_CONNECTED: dict[str, Any] = {
+    "success": False,
+    "message": "Not connected to Furby. Use connect_furby first.",
+}
+_INVALID_RGB: dict[str, Any] = {
+    "success": False,
+    "message": "RGB values must be between 0 and 255",
+}
+_INVALID_MOOD_VALUE: dict[str, Any] = {
+    "success": False,
+    "message": "Mood value must be between 0 and 100",
+}
+
+# Static catalogue served by list_common_actions, built once at import time
+_COMMON_ACTIONS: dict[str, dict[str, Any]] = {
+    "giggle": {
+        "input": 55,
+        "index": 2,
+        "subindex": 14,
+        "specific": 0,
+        "description": "Make Furby giggle",
+    },
+    "puke": {
+        "input": 55,
+        "index": 3,
+        "subindex": 10,
+        "specific": 0,
+        "description": "Make Furby puke (burp)",
+    },
+    "sneeze": {
+        "input": 55,
+        "index": 3,
+        "subindex": 1,
+        "specific": 0,
+        "description": "Make Furby sneeze",
+    },
+    "yawn": {
+        "input": 55,
+        "index": 3,
+        "subindex": 3,
+        "specific": 0,
+        "description": "Make Furby yawn",
+    },
+    "sing_note_c": {
+        "input": 71,
+        "index": 0,
+        "subindex": 0,
+        "specific": 0,
+        "description": "Sing musical note C",
+    },
+    "dance": {
+        "input": 30,
+        "index": 0,
+        "subindex": 0,
+        "specific": 0,
+        "description": "Make Furby dance",
+    },
+}
+
+_COMMON_ACTIONS_RESPONSE: dict[str, Any] = {
+    "success": True,
+    "actions": _COMMON_ACTIONS,
+    "message": (
+        f"Found {len(_COMMON_ACTIONS)} common actions. "
+        "Use trigger_action with these coordinates."
     ),
-)
+}
+
+# The FastMCP server is built lazily: importing this module for its helper
+# functions (e.g. from the CLI) should not pay the cost of importing the MCP
+# framework. The instance is created on first access of `mcp` or run_server().
+_mcp: "FastMCP | None" = None
+
+
+def _build_server() -> "FastMCP":
+    """Create the FastMCP server and register all tools (once)."""
+    global _mcp
+    if _mcp is None:
+        from mcp.server.fastmcp import FastMCP
+
+        _mcp = FastMCP(
+            name="PyFluff Furby Controller",
+            instructions=(
+                "Control Furby Connect toys via Bluetooth. "
+                "First discover or connect to a Furby, then use the control tools. "
+                "Available actions include changing antenna color, triggering actions, "
+                "adjusting mood, and more."
+            ),
+        )
+        for tool in (
+            discover_furbies,
+            connect_furby,
+            disconnect_furby,
+            get_connection_status,
+            set_antenna_color,
+            trigger_action,
+            set_mood,
+            set_lcd_backlight,
+            cycle_debug_menu,
+            list_common_actions,
+        ):
+            _mcp.tool()(tool)
+    return _mcp
+
+
+def __getattr__(name: str) -> Any:
+    """Module-level lazy attribute: `mcp` builds the server on first use."""
+    if name == "mcp":
+        return _build_server()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def _get_furby() -> FurbyConnect:
@@ -39,7 +152,6 @@ def _get_furby() -> FurbyConnect:
     return _furby
 
 
-@mcp.tool()
 async def discover_furbies(timeout: float = 10.0) -> dict[str, Any]:
     """
     Discover nearby Furby Connect devices via Bluetooth.
@@ -75,7 +187,6 @@ async def discover_furbies(timeout: float = 10.0) -> dict[str, Any]:
         }
 
 
-@mcp.tool()
 async def connect_furby(address: str | None = None, timeout: float = 10.0) -> dict[str, Any]:
     """
     Connect to a Furby device.
@@ -91,20 +202,22 @@ async def connect_furby(address: str | None = None, timeout: float = 10.0) -> di
     furby = _get_furby()
 
     try:
+        device = furby.device
         if furby.connected:
             return {
                 "success": True,
                 "message": "Already connected to Furby",
-                "address": getattr(furby.device, "address", "unknown"),
+                "address": device.address if device else "unknown",
             }
 
         logger.info(f"Connecting to Furby{' at ' + address if address else ''}...")
         await furby.connect(address=address, timeout=timeout)
 
+        device = furby.device
         return {
             "success": True,
             "message": "Successfully connected to Furby",
-            "address": getattr(furby.device, "address", "unknown"),
+            "address": device.address if device else "unknown",
         }
     except Exception as e:
         logger.error(f"Connection failed: {e}")
@@ -117,7 +230,6 @@ async def connect_furby(address: str | None = None, timeout: float = 10.0) -> di
         }
 
 
-@mcp.tool()
 async def disconnect_furby() -> dict[str, Any]:
     """
     Disconnect from the current Furby.
@@ -138,7 +250,6 @@ async def disconnect_furby() -> dict[str, Any]:
         return {"success": False, "error": str(e), "message": "Failed to disconnect"}
 
 
-@mcp.tool()
 async def get_connection_status() -> dict[str, Any]:
     """
     Get current Furby connection status.
@@ -148,14 +259,14 @@ async def get_connection_status() -> dict[str, Any]:
     """
     furby = _get_furby()
 
+    device = furby.device
     return {
         "connected": furby.connected,
-        "address": getattr(furby.device, "address", None) if furby.device else None,
-        "name": getattr(furby.device, "name", None) if furby.device else None,
+        "address": device.address if device else None,
+        "name": device.name if device else None,
     }
 
 
-@mcp.tool()
 async def set_antenna_color(red: int, green: int, blue: int) -> dict[str, Any]:
     """
     Set the color of Furby's antenna LED.
@@ -171,17 +282,11 @@ async def set_antenna_color(red: int, green: int, blue: int) -> dict[str, Any]:
     furby = _get_furby()
 
     if not furby.connected:
-        return {
-            "success": False,
-            "message": "Not connected to Furby. Use connect_furby first.",
-        }
+        return _NOT_CONNECTED
 
     # Validate RGB values
     if not all(0 <= v <= 255 for v in [red, green, blue]):
-        return {
-            "success": False,
-            "message": "RGB values must be between 0 and 255",
-        }
+        return _INVALID_RGB
 
     try:
         await furby.set_antenna_color(red, green, blue)
@@ -195,7 +300,6 @@ async def set_antenna_color(red: int, green: int, blue: int) -> dict[str, Any]:
         return {"success": False, "error": str(e), "message": "Failed to set antenna color"}
 
 
-@mcp.tool()
 async def trigger_action(
     input_id: int, index: int = 0, subindex: int = 0, specific: int = 0
 ) -> dict[str, Any]:
@@ -224,10 +328,7 @@ async def trigger_action(
     furby = _get_furby()
 
     if not furby.connected:
-        return {
-            "success": False,
-            "message": "Not connected to Furby. Use connect_furby first.",
-        }
+        return _NOT_CONNECTED
 
     try:
         await furby.trigger_action(input_id, index, subindex, specific)
@@ -246,7 +347,6 @@ async def trigger_action(
         return {"success": False, "error": str(e), "message": "Failed to trigger action"}
 
 
-@mcp.tool()
 async def set_mood(mood_type: str, value: int) -> dict[str, Any]:
     """
     Set a specific mood meter value for Furby.
@@ -268,32 +368,18 @@ async def set_mood(mood_type: str, value: int) -> dict[str, Any]:
     furby = _get_furby()
 
     if not furby.connected:
-        return {
-            "success": False,
-            "message": "Not connected to Furby. Use connect_furby first.",
-        }
+        return _NOT_CONNECTED
 
     # Validate value
     if not 0 <= value <= 100:
-        return {
-            "success": False,
-            "message": "Mood value must be between 0 and 100",
-        }
+        return _INVALID_MOOD_VALUE
 
     # Map mood type string to enum
-    mood_map = {
-        "excitedness": MoodMeterType.EXCITEDNESS,
-        "displeasedness": MoodMeterType.DISPLEASEDNESS,
-        "tiredness": MoodMeterType.TIREDNESS,
-        "fullness": MoodMeterType.FULLNESS,
-        "wellness": MoodMeterType.WELLNESS,
-    }
-
-    mood_enum = mood_map.get(mood_type.lower())
+    mood_enum = _MOOD_MAP.get(mood_type.lower())
     if mood_enum is None:
         return {
             "success": False,
-            "message": f"Invalid mood type. Must be one of: {', '.join(mood_map.keys())}",
+            "message": f"Invalid mood type. Must be one of: {_MOOD_KEYS}",
         }
 
     try:
@@ -308,7 +394,6 @@ async def set_mood(mood_type: str, value: int) -> dict[str, Any]:
         return {"success": False, "error": str(e), "message": "Failed to set mood"}
 
 
-@mcp.tool()
 async def set_lcd_backlight(enabled: bool) -> dict[str, Any]:
     """
     Control Furby's LCD eye backlight.
@@ -322,10 +407,7 @@ async def set_lcd_backlight(enabled: bool) -> dict[str, Any]:
     furby = _get_furby()
 
     if not furby.connected:
-        return {
-            "success": False,
-            "message": "Not connected to Furby. Use connect_furby first.",
-        }
+        return _NOT_CONNECTED
 
     try:
         await furby.set_lcd(enabled)
@@ -339,7 +421,6 @@ async def set_lcd_backlight(enabled: bool) -> dict[str, Any]:
         return {"success": False, "error": str(e), "message": "Failed to set LCD backlight"}
 
 
-@mcp.tool()
 async def cycle_debug_menu() -> dict[str, Any]:
     """
     Cycle through Furby's debug menu screens.
@@ -352,10 +433,7 @@ async def cycle_debug_menu() -> dict[str, Any]:
     furby = _get_furby()
 
     if not furby.connected:
-        return {
-            "success": False,
-            "message": "Not connected to Furby. Use connect_furby first.",
-        }
+        return _NOT_CONNECTED
 
     try:
         await furby.cycle_debug_menu()
@@ -368,7 +446,6 @@ async def cycle_debug_menu() -> dict[str, Any]:
         return {"success": False, "error": str(e), "message": "Failed to cycle debug menu"}
 
 
-@mcp.tool()
 def list_common_actions() -> dict[str, Any]:
     """
     List common Furby actions with their coordinates.
@@ -378,58 +455,7 @@ def list_common_actions() -> dict[str, Any]:
     Returns:
         Dictionary with common action definitions
     """
-    actions = {
-        "giggle": {
-            "input": 55,
-            "index": 2,
-            "subindex": 14,
-            "specific": 0,
-            "description": "Make Furby giggle",
-        },
-        "puke": {
-            "input": 55,
-            "index": 3,
-            "subindex": 10,
-            "specific": 0,
-            "description": "Make Furby puke (burp)",
-        },
-        "sneeze": {
-            "input": 55,
-            "index": 3,
-            "subindex": 1,
-            "specific": 0,
-            "description": "Make Furby sneeze",
-        },
-        "yawn": {
-            "input": 55,
-            "index": 3,
-            "subindex": 3,
-            "specific": 0,
-            "description": "Make Furby yawn",
-        },
-        "sing_note_c": {
-            "input": 71,
-            "index": 0,
-            "subindex": 0,
-            "specific": 0,
-            "description": "Sing musical note C",
-        },
-        "dance": {
-            "input": 30,
-            "index": 0,
-            "subindex": 0,
-            "specific": 0,
-            "description": "Make Furby dance",
-        },
-    }
-
-    return {
-        "success": True,
-        "actions": actions,
-        "message": (
-            f"Found {len(actions)} common actions. " "Use trigger_action with these coordinates."
-        ),
-    }
+    return _COMMON_ACTIONS_RESPONSE
 
 
 def run_server(transport: str = "stdio") -> None:
@@ -440,7 +466,7 @@ def run_server(transport: str = "stdio") -> None:
         transport: Transport type - "stdio", "sse", or "streamable-http"
     """
     logger.info(f"Starting PyFluff MCP server with {transport} transport...")
-    mcp.run(transport=transport)
+    _build_server().run(transport=transport)
 
 
 if __name__ == "__main__":
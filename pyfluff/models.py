@@ -2,9 +2,15 @@
 Pydantic models for data validation and API schemas.
 """
 
+import re
 from typing import Any
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+# BLE device identifiers: a colon-separated MAC on most platforms, a UUID on
+# macOS. Compiled once so validation is a single C-level fullmatch instead of
+# per-instance pattern parsing; re.A skips Unicode property lookups.
+_ADDRESS_RE = re.compile(r"(?:[0-9A-Fa-f]{2}:){5}[0-9A-Fa-f]{2}|[0-9A-Fa-f-]{8,}", re.A)
 
 
 class AntennaColor(BaseModel):
@@ -106,6 +112,13 @@ class KnownFurby(BaseModel):
 
     model_config = ConfigDict(extra="allow")
 
+    @field_validator("address")
+    @classmethod
+    def _validate_address(cls, v: str) -> str:
+        if not _ADDRESS_RE.fullmatch(v):
+            raise ValueError(f"invalid device address: {v!r}")
+        return v
+
 
 class KnownFurbiesConfig(BaseModel):
     """Configuration file for known Furbies"""
@@ -7,7 +7,9 @@ as well as protocol constants for communicating with Furby Connect.
 Based on reverse engineering by Jeija (bluefluff project).
 """
 
+import struct
 from enum import Enum
+from functools import lru_cache
 from typing import Final
 
 
@@ -154,153 +156,205 @@ MAX_PACKET_SIZE: Final[int] = 20
 IDLE_INTERVAL: Final[float] = 3.0  # seconds
 FILE_CHUNK_SIZE: Final[int] = 20  # bytes per BLE packet
 
+# Constant command packets, built once at import. The trivial builders
+# below return these directly instead of allocating identical bytes on
+# every call.
+_LCD_ON: Final[bytes] = bytes([GeneralPlusCommand.LCD_BACKLIGHT.value, 0x01])
+_LCD_OFF: Final[bytes] = bytes([GeneralPlusCommand.LCD_BACKLIGHT.value, 0x00])
+_DEBUG_MENU: Final[bytes] = bytes([GeneralPlusCommand.LCD_DEBUG_MENU.value])
+_ACTIVATE_DLC: Final[bytes] = bytes([GeneralPlusCommand.ACTIVATE_DLC.value])
+_NORDIC_ACK_ON: Final[bytes] = bytes([NordicCommand.PACKET_ACK.value, 0x01, 0x00])
+_NORDIC_ACK_OFF: Final[bytes] = bytes([NordicCommand.PACKET_ACK.value, 0x00, 0x00])
+
+# Pre-compiled packers for the fixed-layout commands. Struct.pack emits
+# the packet in one C call instead of building a Python list and
+# iterating it through bytes().
+_PACK_ANTENNA = struct.Struct("4B").pack
+_PACK_ACTION = struct.Struct("6B").pack
+_PACK_2B = struct.Struct("2B").pack
+_PACK_MOODMETER = struct.Struct("4B").pack
+
+# FurbyMessage lookup keyed by the full two-byte packet prefix. One dict
+# probe per notification replaces the enum constructor and its ValueError
+# path for unknown codes.
+_MSG_TABLE: Final[dict[int, FurbyMessage]] = {
+    (GeneralPlusResponse.FURBY_MESSAGE.value << 8) | msg.value: msg for msg in FurbyMessage
+}
 
-class FurbyProtocol:
+
+def build_antenna_command(red: int, green: int, blue: int) -> bytes:
+    """Build command to set antenna LED color (0-255 for each channel)"""
+    return _PACK_ANTENNA(GeneralPlusCommand.SET_ANTENNA_COLOR.value, red, green, blue)
+
+
+def build_action_command(
+    input: int, index: int, subindex: int, specific: int
+) -> bytes:
+    """Build command to trigger specific action"""
+    return _PACK_ACTION(
+        GeneralPlusCommand.TRIGGER_SPECIFIC_ACTION.value,
+        0x00,
+        input,
+        index,
+        subindex,
+        specific,
+    )
+
+
+def build_lcd_command(enabled: bool) -> bytes:
+    """Build command to control LCD backlight"""
+    return _LCD_ON if enabled else _LCD_OFF
+
+
+def build_debug_menu_command() -> bytes:
+    """Build command to cycle through debug menus"""
+    return _DEBUG_MENU
+
+
+def build_name_command(name_id: int) -> bytes:
+    """Build command to set Furby name (0-128)"""
+    return _PACK_2B(GeneralPlusCommand.SET_NAME.value, name_id)
+
+
+# The argument space is small (2 actions x 5 types x 256 values), so the
+# cache converges to returning shared packets with no construction at all
+# on the steady-state mood-update path.
+@lru_cache(maxsize=4096)
+def build_moodmeter_command(
+    action: int, mood_type: MoodMeterType, value: int
+) -> bytes:
     """
-    Helper class for building and parsing Furby Connect protocol packets.
+    Build command to set mood meter.
+    action: 1 = set value, 0 = increase value
+    mood_type: MoodMeterType enum
+    value: new value (action=1) or delta (action=0)
     """
+    return _PACK_MOODMETER(
+        GeneralPlusCommand.SET_MOODMETER.value, action, mood_type.value, value
+    )
+
+
+def build_dlc_announce_command(
+    size: int, slot: int, filename: str
+) -> bytes:
+    """Build command to announce DLC upload"""
+    # Assemble in a zero-initialized buffer: the filename padding and
+    # the two trailing reserved bytes come for free, avoiding the
+    # intermediate ljust/concat allocations.
+    buf = bytearray(20)
+    buf[0] = GeneralPlusCommand.ANNOUNCE_DLC_UPLOAD.value
+    # buf[1] is reserved (0x00); size is 3 bytes big-endian
+    buf[2] = (size >> 16) & 0xFF
+    buf[3] = (size >> 8) & 0xFF
+    buf[4] = size & 0xFF
+    buf[5] = slot
+    name = filename.encode("ascii")[:12]
+    buf[6 : 6 + len(name)] = name
+    return bytes(buf)
+
+
+def build_load_dlc_command(slot: int) -> bytes:
+    """Build command to load DLC from slot"""
+    return _PACK_2B(GeneralPlusCommand.LOAD_DLC.value, slot)
+
+
+def build_activate_dlc_command() -> bytes:
+    """Build command to activate loaded DLC"""
+    return _ACTIVATE_DLC
+
+
+def build_deactivate_dlc_command(slot: int) -> bytes:
+    """Build command to deactivate DLC slot"""
+    return _PACK_2B(GeneralPlusCommand.DEACTIVATE_DLC.value, slot)
 
-    @staticmethod
-    def build_antenna_command(red: int, green: int, blue: int) -> bytes:
-        """Build command to set antenna LED color (0-255 for each channel)"""
-        return bytes([GeneralPlusCommand.SET_ANTENNA_COLOR.value, red, green, blue])
-
-    @staticmethod
-    def build_action_command(
-        input: int, index: int, subindex: int, specific: int
-    ) -> bytes:
-        """Build command to trigger specific action"""
-        return bytes(
-            [
-                GeneralPlusCommand.TRIGGER_SPECIFIC_ACTION.value,
-                0x00,
-                input,
-                index,
-                subindex,
-                specific,
-            ]
-        )
-
-    @staticmethod
-    def build_lcd_command(enabled: bool) -> bytes:
-        """Build command to control LCD backlight"""
-        return bytes([GeneralPlusCommand.LCD_BACKLIGHT.value, 0x01 if enabled else 0x00])
-
-    @staticmethod
-    def build_debug_menu_command() -> bytes:
-        """Build command to cycle through debug menus"""
-        return bytes([GeneralPlusCommand.LCD_DEBUG_MENU.value])
-
-    @staticmethod
-    def build_name_command(name_id: int) -> bytes:
-        """Build command to set Furby name (0-128)"""
-        return bytes([GeneralPlusCommand.SET_NAME.value, name_id])
-
-    @staticmethod
-    def build_moodmeter_command(
-        action: int, mood_type: MoodMeterType, value: int
-    ) -> bytes:
-        """
-        Build command to set mood meter.
-        action: 1 = set value, 0 = increase value
-        mood_type: MoodMeterType enum
-        value: new value (action=1) or delta (action=0)
-        """
-        return bytes(
-            [GeneralPlusCommand.SET_MOODMETER.value, action, mood_type.value, value]
-        )
-
-    @staticmethod
-    def build_dlc_announce_command(
-        size: int, slot: int, filename: str
-    ) -> bytes:
-        """Build command to announce DLC upload"""
-        # Size is 3 bytes (big-endian)
-        size_bytes = bytes([(size >> 16) & 0xFF, (size >> 8) & 0xFF, size & 0xFF])
-        # Filename is 12 bytes, padded with nulls
-        filename_bytes = filename.encode("ascii")[:12].ljust(12, b"\x00")
-        return bytes(
-            [GeneralPlusCommand.ANNOUNCE_DLC_UPLOAD.value, 0x00]
-            + list(size_bytes)
-            + [slot]
-            + list(filename_bytes)
-            + [0x00, 0x00]
-        )
-
-    @staticmethod
-    def build_load_dlc_command(slot: int) -> bytes:
-        """Build command to load DLC from slot"""
-        return bytes([GeneralPlusCommand.LOAD_DLC.value, slot])
-
-    @staticmethod
-    def build_activate_dlc_command() -> bytes:
-        """Build command to activate loaded DLC"""
-        return bytes([GeneralPlusCommand.ACTIVATE_DLC.value])
-
-    @staticmethod
-    def build_deactivate_dlc_command(slot: int) -> bytes:
-        """Build command to deactivate DLC slot"""
-        return bytes([GeneralPlusCommand.DEACTIVATE_DLC.value, slot])
-
-    @staticmethod
-    def build_delete_dlc_command(slot: int) -> bytes:
-        """Build command to delete DLC slot"""
-        return bytes([GeneralPlusCommand.DELETE_DLC_SLOT.value, slot])
-
-    @staticmethod
-    def build_nordic_packet_ack(enabled: bool) -> bytes:
-        """Build Nordic command to enable/disable packet acknowledgment"""
-        return bytes([NordicCommand.PACKET_ACK.value, 0x01 if enabled else 0x00, 0x00])
-
-    @staticmethod
-    def parse_response(data: bytes) -> tuple[int, bytes]:
-        """Parse response packet, returning (command_id, payload)"""
-        if len(data) == 0:
-            raise ValueError("Empty response packet")
-        return data[0], data[1:]
-
-    @staticmethod
-    def is_furby_message(data: bytes) -> bool:
-        """Check if response is a FurbyMessage (0x20)"""
-        return len(data) > 0 and data[0] == GeneralPlusResponse.FURBY_MESSAGE.value
-
-    @staticmethod
-    def get_furby_message_type(data: bytes) -> FurbyMessage | None:
-        """Extract FurbyMessage type from response"""
-        if len(data) >= 2 and FurbyProtocol.is_furby_message(data):
-            try:
-                return FurbyMessage(data[1])
-            except ValueError:
-                return None
+
+def build_delete_dlc_command(slot: int) -> bytes:
+    """Build command to delete DLC slot"""
+    return _PACK_2B(GeneralPlusCommand.DELETE_DLC_SLOT.value, slot)
+
+
+def build_nordic_packet_ack(enabled: bool) -> bytes:
+    """Build Nordic command to enable/disable packet acknowledgment"""
+    return _NORDIC_ACK_ON if enabled else _NORDIC_ACK_OFF
+
+
+def parse_response(data: bytes) -> tuple[int, bytes]:
+    """Parse response packet, returning (command_id, payload)"""
+    if len(data) == 0:
+        raise ValueError("Empty response packet")
+    return data[0], data[1:]
+
+
+def parse_response_view(data: bytes) -> tuple[int, memoryview]:
+    """
+    Parse response packet without copying the payload.
+
+    Like parse_response, but the payload is a memoryview into the
+    original packet, so per-notification callers that only inspect a
+    byte or two skip the slice allocation.
+    """
+    if len(data) == 0:
+        raise ValueError("Empty response packet")
+    return data[0], memoryview(data)[1:]
+
+
+def is_furby_message(data: bytes) -> bool:
+    """Check if response is a FurbyMessage (0x20)"""
+    return len(data) > 0 and data[0] == GeneralPlusResponse.FURBY_MESSAGE.value
+
+
+def get_furby_message_type(data: bytes) -> FurbyMessage | None:
+    """Extract FurbyMessage type from response"""
+    if len(data) < 2:
         return None
+    return _MSG_TABLE.get((data[0] << 8) | data[1])
 
 
-# Furby name database (129 names, IDs 0-128)
-FURBY_NAMES: dict[int, str] = {
-    0: "Ah-Bay", 1: "Ah-Boh", 2: "Ah-Boo", 3: "Ah-Dah", 4: "Ah-Doh",
-    5: "Ah-Doo", 6: "Ah-Kah", 7: "Ah-Koh", 8: "Ah-Tah", 9: "Ah-Toh",
-    10: "Bee-Bay", 11: "Bee-Boh", 12: "Bee-Boo", 13: "Bee-Dah", 14: "Bee-Doh",
-    15: "Bee-Doo", 16: "Bee-Kah", 17: "Bee-Koh", 18: "Bee-Tah", 19: "Bee-Toh",
-    20: "Dah-Bay", 21: "Dah-Boh", 22: "Dah-Boo", 23: "Dah-Dah", 24: "Dah-Doh",
-    25: "Dah-Doo", 26: "Dah-Kah", 27: "Dah-Koh", 28: "Dah-Tah", 29: "Dah-Toh",
-    30: "Day-Bay", 31: "Day-Boh", 32: "Day-Boo", 33: "Day-Dah", 34: "Day-Doh",
-    35: "Day-Doo", 36: "Day-Kah", 37: "Day-Koh", 38: "Day-Tah", 39: "Day-Toh",
-    40: "Dee-Bay", 41: "Dee-Boh", 42: "Dee-Boo", 43: "Dee-Dah", 44: "Dee-Doh",
-    45: "Dee-Doo", 46: "Dee-Kah", 47: "Dee-Koh", 48: "Dee-Tah", 49: "Dee-Toh",
-    50: "Doo-Bay", 51: "Doo-Boh", 52: "Doo-Boo", 53: "Doo-Dah", 54: "Doo-Doh",
-    55: "Doo-Doo", 56: "Doo-Kah", 57: "Doo-Koh", 58: "Doo-Tah", 59: "Doo-Toh",
-    60: "Kee-Bay", 61: "Kee-Boh", 62: "Kee-Boo", 63: "Kee-Dah", 64: "Kee-Doh",
-    65: "Kee-Doo", 66: "Kee-Kah", 67: "Kee-Koh", 68: "Kee-Tah", 69: "Kee-Toh",
-    70: "Loo-Bay", 71: "Loo-Boh", 72: "Loo-Boo", 73: "Loo-Dah", 74: "Loo-Doh",
-    75: "Loo-Doo", 76: "Loo-Kah", 77: "Loo-Koh", 78: "Loo-Tah", 79: "Loo-Toh",
-    80: "May-Bay", 81: "May-Boh", 82: "May-Boo", 83: "May-Dah", 84: "May-Doh",
-    85: "May-Doo", 86: "May-Kah", 87: "May-Koh", 88: "May-Tah", 89: "May-Toh",
-    90: "Noo-Bay", 91: "Noo-Boh", 92: "Noo-Boo", 93: "Noo-Dah", 94: "Noo-Doh",
-    95: "Noo-Doo", 96: "Noo-Kah", 97: "Noo-Koh", 98: "Noo-Tah", 99: "Noo-Toh",
-    100: "Tay-Bay", 101: "Tay-Boh", 102: "Tay-Boo", 103: "Tay-Dah", 104: "Tay-Doh",
-    105: "Tay-Doo", 106: "Tay-Kah", 107: "Tay-Koh", 108: "Tay-Toh",
-    109: "Toh-Bay", 110: "Toh-Boh", 111: "Toh-Boo", 112: "Toh-Dah", 113: "Toh-Doh",
-    114: "Toh-Doo", 115: "Toh-Kah", 116: "Toh-Koh", 117: "Toh-Tah", 118: "Toh-Toh",
-    119: "Way-Bay", 120: "Way-Boh", 121: "Way-Boo", 122: "Way-Dah", 123: "Way-Doh",
-    124: "Way-Doo", 125: "Way-Kah", 126: "Way-Koh", 127: "Way-Tah", 128: "Way-Toh",
-}
+class FurbyProtocol:
+    """
+    Helper class for building and parsing Furby Connect protocol packets.
+
+    The builders and parsers live as module-level functions so hot
+    callers can import them directly; this class re-exports them as
+    staticmethods to keep the established FurbyProtocol.build_x API.
+    """
+
+    build_antenna_command = staticmethod(build_antenna_command)
+    build_action_command = staticmethod(build_action_command)
+    build_lcd_command = staticmethod(build_lcd_command)
+    build_debug_menu_command = staticmethod(build_debug_menu_command)
+    build_name_command = staticmethod(build_name_command)
+    build_moodmeter_command = staticmethod(build_moodmeter_command)
+    build_dlc_announce_command = staticmethod(build_dlc_announce_command)
+    build_load_dlc_command = staticmethod(build_load_dlc_command)
+    build_activate_dlc_command = staticmethod(build_activate_dlc_command)
+    build_deactivate_dlc_command = staticmethod(build_deactivate_dlc_command)
+    build_delete_dlc_command = staticmethod(build_delete_dlc_command)
+    build_nordic_packet_ack = staticmethod(build_nordic_packet_ack)
+    parse_response = staticmethod(parse_response)
+    parse_response_view = staticmethod(parse_response_view)
+    is_furby_message = staticmethod(is_furby_message)
+    get_furby_message_type = staticmethod(get_furby_message_type)
+
+
+# Furby name database (129 names, IDs 0-128). A tuple indexed by name ID:
+# the IDs are contiguous from zero, so positional indexing replaces the
+# hash probe a dict lookup would cost.
+FURBY_NAMES: tuple[str, ...] = (
+    "Ah-Bay", "Ah-Boh", "Ah-Boo", "Ah-Dah", "Ah-Doh", "Ah-Doo", "Ah-Kah", "Ah-Koh", "Ah-Tah",
+    "Ah-Toh", "Bee-Bay", "Bee-Boh", "Bee-Boo", "Bee-Dah", "Bee-Doh", "Bee-Doo", "Bee-Kah",
+    "Bee-Koh", "Bee-Tah", "Bee-Toh", "Dah-Bay", "Dah-Boh", "Dah-Boo", "Dah-Dah", "Dah-Doh",
+    "Dah-Doo", "Dah-Kah", "Dah-Koh", "Dah-Tah", "Dah-Toh", "Day-Bay", "Day-Boh", "Day-Boo",
+    "Day-Dah", "Day-Doh", "Day-Doo", "Day-Kah", "Day-Koh", "Day-Tah", "Day-Toh", "Dee-Bay",
+    "Dee-Boh", "Dee-Boo", "Dee-Dah", "Dee-Doh", "Dee-Doo", "Dee-Kah", "Dee-Koh", "Dee-Tah",
+    "Dee-Toh", "Doo-Bay", "Doo-Boh", "Doo-Boo", "Doo-Dah", "Doo-Doh", "Doo-Doo", "Doo-Kah",
+    "Doo-Koh", "Doo-Tah", "Doo-Toh", "Kee-Bay", "Kee-Boh", "Kee-Boo", "Kee-Dah", "Kee-Doh",
+    "Kee-Doo", "Kee-Kah", "Kee-Koh", "Kee-Tah", "Kee-Toh", "Loo-Bay", "Loo-Boh", "Loo-Boo",
+    "Loo-Dah", "Loo-Doh", "Loo-Doo", "Loo-Kah", "Loo-Koh", "Loo-Tah", "Loo-Toh", "May-Bay",
+    "May-Boh", "May-Boo", "May-Dah", "May-Doh", "May-Doo", "May-Kah", "May-Koh", "May-Tah",
+    "May-Toh", "Noo-Bay", "Noo-Boh", "Noo-Boo", "Noo-Dah", "Noo-Doh", "Noo-Doo", "Noo-Kah",
+    "Noo-Koh", "Noo-Tah", "Noo-Toh", "Tay-Bay", "Tay-Boh", "Tay-Boo", "Tay-Dah", "Tay-Doh",
+    "Tay-Doo", "Tay-Kah", "Tay-Koh", "Tay-Toh", "Toh-Bay", "Toh-Boh", "Toh-Boo", "Toh-Dah",
+    "Toh-Doh", "Toh-Doo", "Toh-Kah", "Toh-Koh", "Toh-Tah", "Toh-Toh", "Way-Bay", "Way-Boh",
+    "Way-Boo", "Way-Dah", "Way-Doh", "Way-Doo", "Way-Kah", "Way-Koh", "Way-Tah", "Way-Toh",
+)
@@ -0,0 +1,376 @@
+"""
+Tests for DLC upload and slot management.
+"""
+
+import asyncio
+from collections.abc import Callable
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+import pytest
+
+from pyfluff.dlc import WRITE_CREDITS, DLCManager
+
+
+class _FakeFurby:
+    """
+    Minimal stand-in for FurbyConnect exposing only what DLCManager touches.
+
+    A plain class keeps fixture setup cheap; AsyncMock is used only for the
+    write methods so tests can assert on calls.
+    """
+
+    def __init__(self) -> None:
+        self._gp_callbacks: list[Callable[[bytes], None]] = []
+        self._nordic_callbacks: list[Callable[[bytes], None]] = []
+        self._nordic_ack_enabled = False
+        self._write_gp = AsyncMock()
+        self._write_file = AsyncMock()
+
+        async def _track_ack(enabled: bool = True) -> None:
+            self._nordic_ack_enabled = enabled
+
+        self.enable_nordic_packet_ack = AsyncMock(side_effect=_track_ack)
+
+    def add_gp_callback(
+        self, callback: Callable[[bytes], None], opcode: int | None = None
+    ) -> None:
+        self._gp_callbacks.append(callback)
+
+    def remove_gp_callback(
+        self, callback: Callable[[bytes], None], opcode: int | None = None
+    ) -> None:
+        if callback in self._gp_callbacks:
+            self._gp_callbacks.remove(callback)
+
+    def add_nordic_callback(self, callback: Callable[[bytes], None]) -> None:
+        self._nordic_callbacks.append(callback)
+
+    def remove_nordic_callback(self, callback: Callable[[bytes], None]) -> None:
+        if callback in self._nordic_callbacks:
+            self._nordic_callbacks.remove(callback)
+
+
+@pytest.fixture
+def mock_furby() -> _FakeFurby:
+    """Fake FurbyConnect exposing the pieces DLCManager touches."""
+    return _FakeFurby()
+
+
+@pytest.fixture
+def dlc_manager(mock_furby: _FakeFurby) -> DLCManager:
+    return DLCManager(mock_furby)
+
+
+def _drive_transfer(dlc_manager: DLCManager) -> None:
+    """Schedule ready/complete signals as Furby would send them."""
+    loop = asyncio.get_running_loop()
+    loop.call_later(0.01, dlc_manager._transfer_ready.set)
+    loop.call_later(0.03, dlc_manager._transfer_complete.set)
+
+
+class TestFileTransferCallback:
+    @pytest.mark.parametrize(
+        "payload,ready,complete,error",
+        [
+            (bytes([0x24, 0x02]), True, False, None),
+            (bytes([0x24, 0x05]), False, True, None),
+            (bytes([0x24, 0x06]), False, True, "File transfer failed"),
+            (bytes([0x24, 0x03]), False, True, "File transfer timeout"),
+            (bytes([0x24]), False, False, None),
+            (bytes([0x21, 0x02]), False, False, None),
+            (bytes([0x24, 0xFF]), False, False, None),
+        ],
+        ids=["ready", "ok", "error", "timeout", "short", "wrong_opcode", "unknown_mode"],
+    )
+    def test_file_transfer_callback(
+        self,
+        dlc_manager: DLCManager,
+        payload: bytes,
+        ready: bool,
+        complete: bool,
+        error: str | None,
+    ) -> None:
+        dlc_manager._file_transfer_callback(payload)
+        assert dlc_manager._transfer_ready.is_set() is ready
+        assert dlc_manager._transfer_complete.is_set() is complete
+        assert dlc_manager._transfer_error == error
+
+
+class TestUploadDLC:
+    async def test_upload_dlc_file_not_found(self, dlc_manager: DLCManager) -> None:
+        with pytest.raises(FileNotFoundError):
+            await dlc_manager.upload_dlc(Path("/nonexistent/file.dlc"))
+
+    async def test_upload_dlc_sends_file_chunks(
+        self, dlc_manager: DLCManager, mock_furby: _FakeFurby
+    ) -> None:
+        _drive_transfer(dlc_manager)
+        await dlc_manager.upload_dlc(b"TEST" * 25, slot=2)  # 100 bytes -> 5 chunks
+
+        assert mock_furby._write_file.await_count == 5
+        sent = b"".join(
+            bytes(call.args[0]) for call in mock_furby._write_file.await_args_list
+        )
+        assert sent == b"TEST" * 25
+
+    async def test_upload_dlc_enables_nordic_ack(
+        self, dlc_manager: DLCManager, mock_furby: _FakeFurby, tmp_path: Path
+    ) -> None:
+        dlc_file = tmp_path / "TEST.DLC"
+        dlc_file.write_bytes(b"TEST")
+
+        _drive_transfer(dlc_manager)
+        await dlc_manager.upload_dlc(dlc_file)
+
+        mock_furby.enable_nordic_packet_ack.assert_awaited_once_with(True)
+
+    async def test_upload_dlc_acks_refill_credits(
+        self, dlc_manager: DLCManager, mock_furby: _FakeFurby, tmp_path: Path
+    ) -> None:
+        """Nordic packet ACKs release write credits during the transfer."""
+        dlc_file = tmp_path / "TEST.DLC"
+        # More chunks than initial credits, so ACKs are needed to keep going
+        dlc_file.write_bytes(b"X" * (20 * (WRITE_CREDITS + 4)))
+
+        async def ack_each_write(data: object) -> None:
+            for callback in mock_furby._nordic_callbacks:
+                callback(bytes([0x09, 0x01]))
+
+        mock_furby._write_file = AsyncMock(side_effect=ack_each_write)
+
+        _drive_transfer(dlc_manager)
+        await dlc_manager.upload_dlc(dlc_file)
+
+        assert mock_furby._write_file.await_count == WRITE_CREDITS + 4
+
+    async def test_upload_dlc_fixed_pacing_without_ack(
+        self,
+        dlc_manager: DLCManager,
+        mock_furby: _FakeFurby,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Without Nordic ACKs the loop falls back to chunk_delay pacing."""
+        dlc_file = tmp_path / "TEST.DLC"
+        dlc_file.write_bytes(b"TEST" * 25)
+
+        sleeps: list[float] = []
+        real_sleep = asyncio.sleep
+
+        async def recording_sleep(delay: float) -> None:
+            sleeps.append(delay)
+            await real_sleep(0)
+
+        # Patch only the dlc module's pacing sleep so the event loop's own
+        # sleeps (and _drive_transfer) keep working normally.
+        monkeypatch.setattr("pyfluff.dlc._sleep", recording_sleep)
+
+        _drive_transfer(dlc_manager)
+        await dlc_manager.upload_dlc(dlc_file, enable_nordic_ack=False, chunk_delay=0.001)
+
+        mock_furby.enable_nordic_packet_ack.assert_not_awaited()
+        assert 0.001 * 4 in sleeps or 0.001 in sleeps
+
+    async def test_upload_dlc_fails_fast_if_error_before_ready(
+        self, dlc_manager: DLCManager, mock_furby: _FakeFurby, tmp_path: Path
+    ) -> None:
+        """An error posted before READY_TO_RECEIVE aborts without waiting."""
+        dlc_file = tmp_path / "TEST.DLC"
+        dlc_file.write_bytes(b"TEST")
+
+        def fail_transfer() -> None:
+            dlc_manager._transfer_error = "File transfer failed"
+            dlc_manager._transfer_complete.set()
+
+        loop = asyncio.get_running_loop()
+        loop.call_later(0.01, fail_transfer)
+
+        start = loop.time()
+        with pytest.raises(RuntimeError, match="File transfer failed"):
+            await dlc_manager.upload_dlc(dlc_file)
+        assert loop.time() - start < 5.0  # well under the 10 s ready timeout
+
+    async def test_upload_dlc_streams_large_file(
+        self,
+        dlc_manager: DLCManager,
+        mock_furby: _FakeFurby,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """A multi-block file is streamed fully, one write per chunk."""
+        dlc_file = tmp_path / "BIG.DLC"
+        file_size = 256 * 1024  # spans many read blocks
+        dlc_file.write_bytes(b"\xab" * file_size)
+
+        async def no_sleep(delay: float) -> None:
+            pass
+
+        monkeypatch.setattr("pyfluff.dlc._sleep", no_sleep)
+
+        _drive_transfer(dlc_manager)
+        await dlc_manager.upload_dlc(dlc_file, enable_nordic_ack=False)
+
+        assert mock_furby._write_file.await_count == file_size // 20 + 1
+        total = sum(len(call.args[0]) for call in mock_furby._write_file.await_args_list)
+        assert total == file_size
+
+    @pytest.mark.parametrize("chunk_size,expected_writes", [(20, 5), (40, 3), (100, 1)])
+    async def test_upload_dlc_respects_chunk_size(
+        self,
+        dlc_manager: DLCManager,
+        mock_furby: _FakeFurby,
+        chunk_size: int,
+        expected_writes: int,
+    ) -> None:
+        """Chunks can be coalesced into larger GATT writes."""
+        _drive_transfer(dlc_manager)
+        await dlc_manager.upload_dlc(b"TEST" * 25, chunk_size=chunk_size)  # 100 bytes
+
+        assert mock_furby._write_file.await_count == expected_writes
+        sent = b"".join(
+            bytes(call.args[0]) for call in mock_furby._write_file.await_args_list
+        )
+        assert sent == b"TEST" * 25
+
+    async def test_upload_dlc_handles_transfer_error(
+        self, dlc_manager: DLCManager, mock_furby: _FakeFurby, tmp_path: Path
+    ) -> None:
+        dlc_file = tmp_path / "TEST.DLC"
+        dlc_file.write_bytes(b"TEST")
+
+        def fail_transfer() -> None:
+            dlc_manager._transfer_error = "File transfer failed"
+            dlc_manager._transfer_complete.set()
+
+        loop = asyncio.get_running_loop()
+        loop.call_later(0.01, dlc_manager._transfer_ready.set)
+        loop.call_later(0.03, fail_transfer)
+        with pytest.raises(RuntimeError, match="File transfer failed"):
+            await dlc_manager.upload_dlc(dlc_file)
+
+    async def test_upload_dlc_removes_callbacks(
+        self, dlc_manager: DLCManager, mock_furby: _FakeFurby, tmp_path: Path
+    ) -> None:
+        dlc_file = tmp_path / "TEST.DLC"
+        dlc_file.write_bytes(b"TEST")
+
+        _drive_transfer(dlc_manager)
+        await dlc_manager.upload_dlc(dlc_file)
+
+        assert dlc_manager._file_transfer_callback not in mock_furby._gp_callbacks
+        assert mock_furby._nordic_callbacks == []
+
+
+class TestUploadMany:
+    async def test_upload_many_registers_callback_once(
+        self, dlc_manager: DLCManager, mock_furby: _FakeFurby, tmp_path: Path
+    ) -> None:
+        """Bulk uploads share one transfer callback registration."""
+        uploads = []
+        for i in range(3):
+            dlc_file = tmp_path / f"FILE{i}.DLC"
+            dlc_file.write_bytes(b"TEST")
+            uploads.append((dlc_file, i))
+
+        registrations: list[object] = []
+        original_add = mock_furby.add_gp_callback
+
+        def counting_add(cb: object, opcode: int | None = None) -> None:
+            registrations.append(cb)
+            original_add(cb, opcode)
+
+        mock_furby.add_gp_callback = counting_add
+
+        # Each announce write triggers the ready/complete sequence for
+        # that file, as Furby would.
+        async def announce_side_effect(cmd: bytes) -> None:
+            loop = asyncio.get_running_loop()
+            loop.call_later(0.005, dlc_manager._transfer_ready.set)
+            loop.call_later(0.01, dlc_manager._transfer_complete.set)
+
+        mock_furby._write_gp = AsyncMock(side_effect=announce_side_effect)
+
+        await dlc_manager.upload_many(uploads)
+
+        assert len(registrations) == 1
+        assert mock_furby._write_gp.await_count == 3
+        assert mock_furby._write_file.await_count == 3
+        assert mock_furby._gp_callbacks == []
+        assert mock_furby._nordic_callbacks == []
+
+
+class TestFlashAndActivate:
+    def _wire_furby(
+        self, dlc_manager: DLCManager, mock_furby: _FakeFurby, *, confirm_delete: bool
+    ) -> None:
+        """Answer GP writes the way Furby would during a flash pipeline."""
+
+        async def gp_side_effect(cmd: bytes) -> None:
+            loop = asyncio.get_running_loop()
+            if cmd[0] == 0x74 and confirm_delete:
+                for callback in list(mock_furby._gp_callbacks):
+                    callback(bytes([0x74, cmd[1]]))
+            elif cmd[0] == 0x50:  # announce -> ready/complete
+                loop.call_later(0.005, dlc_manager._transfer_ready.set)
+                loop.call_later(0.01, dlc_manager._transfer_complete.set)
+
+        mock_furby._write_gp = AsyncMock(side_effect=gp_side_effect)
+
+    async def test_flash_and_activate_with_delete_confirmation(
+        self, dlc_manager: DLCManager, mock_furby: _FakeFurby, tmp_path: Path
+    ) -> None:
+        """A delete confirmation lets the pipeline proceed immediately."""
+        dlc_file = tmp_path / "TEST.DLC"
+        dlc_file.write_bytes(b"TEST")
+        self._wire_furby(dlc_manager, mock_furby, confirm_delete=True)
+
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        await dlc_manager.flash_and_activate(dlc_file, slot=2)
+
+        # Never hit the DELETE_ACK_TIMEOUT fallback
+        assert loop.time() - start < 1.0
+        commands = [bytes(call.args[0])[0] for call in mock_furby._write_gp.await_args_list]
+        assert commands == [0x74, 0x50, 0x60, 0x61]  # delete, announce, load, activate
+        assert mock_furby._write_file.await_count == 1
+        assert mock_furby._gp_callbacks == []
+
+    async def test_flash_and_activate_without_delete_confirmation(
+        self,
+        dlc_manager: DLCManager,
+        mock_furby: _FakeFurby,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """With no confirmation the pipeline falls through after the timeout."""
+        dlc_file = tmp_path / "TEST.DLC"
+        dlc_file.write_bytes(b"TEST")
+        self._wire_furby(dlc_manager, mock_furby, confirm_delete=False)
+        # Shorten the fallback so the test doesn't wait the real 2 s
+        monkeypatch.setattr("pyfluff.dlc.DELETE_ACK_TIMEOUT", 0.05)
+
+        await dlc_manager.flash_and_activate(dlc_file, slot=2)
+
+        commands = [bytes(call.args[0])[0] for call in mock_furby._write_gp.await_args_list]
+        assert commands == [0x74, 0x50, 0x60, 0x61]
+        assert mock_furby._write_file.await_count == 1
+        assert mock_furby._gp_callbacks == []
+
+
+class TestSlotCommands:
+    async def test_load_dlc(self, dlc_manager: DLCManager, mock_furby: _FakeFurby) -> None:
+        await dlc_manager.load_dlc(2)
+        mock_furby._write_gp.assert_awaited_once_with(bytes([0x60, 2]))
+
+    async def test_activate_dlc(self, dlc_manager: DLCManager, mock_furby: _FakeFurby) -> None:
+        await dlc_manager.activate_dlc()
+        mock_furby._write_gp.assert_awaited_once_with(bytes([0x61]))
+
+    async def test_deactivate_dlc(self, dlc_manager: DLCManager, mock_furby: _FakeFurby) -> None:
+        await dlc_manager.deactivate_dlc(3)
+        mock_furby._write_gp.assert_awaited_once_with(bytes([0x62, 3]))
+
+    async def test_delete_dlc(self, dlc_manager: DLCManager, mock_furby: _FakeFurby) -> None:
+        await dlc_manager.delete_dlc(1)
+        mock_furby._write_gp.assert_awaited_once_with(bytes([0x74, 1]))
@@ -0,0 +1,240 @@
+"""
+Tests for the FurbyCache persistence layer.
+"""
+
+import json
+from itertools import count
+from pathlib import Path
+
+import pytest
+from pydantic import ValidationError
+
+from pyfluff.furby_cache import FurbyCache
+
+ADDR_A = "AA:BB:CC:DD:EE:FF"
+ADDR_B = "11:22:33:44:55:66"
+ADDR_C = "77:88:99:AA:BB:CC"
+
+
+@pytest.fixture(scope="module")
+def cache_root(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """One temp directory for the whole module; each test gets its own file."""
+    return tmp_path_factory.mktemp("furby-cache")
+
+
+@pytest.fixture
+def cache_path(cache_root: Path, request: pytest.FixtureRequest) -> Path:
+    return cache_root / f"{request.node.name}.json"
+
+
+@pytest.fixture
+def cache(cache_path: Path) -> FurbyCache:
+    return FurbyCache(cache_path)
+
+
+class TestFurbyCache:
+    def test_add_furby(self, cache: FurbyCache) -> None:
+        furby = cache.add_or_update(ADDR_A, device_name="Furby")
+        assert furby.address == ADDR_A
+        assert furby.device_name == "Furby"
+        assert furby.last_seen > 0
+
+    def test_get_unknown_returns_none(self, cache: FurbyCache) -> None:
+        assert cache.get(ADDR_A) is None
+
+    def test_add_invalid_address_rejected(self, cache: FurbyCache) -> None:
+        with pytest.raises(ValidationError):
+            cache.add_or_update("not a mac")
+
+    @pytest.mark.parametrize(
+        "kwargs,field,expected",
+        [
+            ({"device_name": "Furby"}, "device_name", "Furby"),
+            ({"name": "Ah-Koh"}, "name", "Ah-Koh"),
+            ({"name_id": 42}, "name_id", 42),
+            ({"firmware_revision": "1.2.3"}, "firmware_revision", "1.2.3"),
+        ],
+        ids=["device_name", "name", "name_id", "firmware"],
+    )
+    def test_update_single_field(
+        self, cache: FurbyCache, kwargs: dict, field: str, expected: object
+    ) -> None:
+        """Each optional field can be set on its own without clearing others."""
+        cache.add_or_update(ADDR_A)
+        cache.add_or_update(ADDR_A, **kwargs)
+        furby = cache.get(ADDR_A)
+        assert furby is not None
+        assert getattr(furby, field) == expected
+
+    def test_update_existing_furby(self, cache: FurbyCache) -> None:
+        first = cache.add_or_update(ADDR_A, device_name="Furby")
+        first_seen = first.last_seen
+        updated = cache.add_or_update(ADDR_A, name="Dah-Boo", name_id=42)
+        assert updated.device_name == "Furby"  # preserved
+        assert updated.name == "Dah-Boo"
+        assert updated.name_id == 42
+        assert updated.last_seen >= first_seen
+        assert len(cache.get_all()) == 1
+
+    def test_update_name(self, cache: FurbyCache) -> None:
+        cache.add_or_update(ADDR_A)
+        cache.update_name(ADDR_A, "Way-Loh", 7)
+        furby = cache.get(ADDR_A)
+        assert furby is not None
+        assert furby.name == "Way-Loh"
+        assert furby.name_id == 7
+
+    def test_get_addresses(self, cache: FurbyCache) -> None:
+        cache.add_or_update(ADDR_A)
+        cache.add_or_update(ADDR_B)
+        assert set(cache.get_addresses()) == {ADDR_A, ADDR_B}
+
+    def test_list_all_furbies(self, cache: FurbyCache) -> None:
+        cache.add_or_update(ADDR_A)
+        cache.add_or_update(ADDR_B)
+        cache.add_or_update(ADDR_C)
+        assert {f.address for f in cache.get_all()} == {ADDR_A, ADDR_B, ADDR_C}
+
+    def test_list_sorted_by_last_seen(self, cache_path: Path) -> None:
+        # A counter clock gives strictly increasing timestamps without
+        # sleeping between updates
+        cache = FurbyCache(cache_path, clock=count(1.0).__next__)
+        cache.add_or_update(ADDR_A)
+        cache.add_or_update(ADDR_B)
+        cache.add_or_update(ADDR_C)
+        assert [f.address for f in cache.get_all()] == [ADDR_C, ADDR_B, ADDR_A]
+
+    def test_get_most_recent(self, cache_path: Path) -> None:
+        cache = FurbyCache(cache_path, clock=count(1.0).__next__)
+        assert cache.get_most_recent() is None
+        cache.add_or_update(ADDR_A)
+        cache.add_or_update(ADDR_B)
+        most_recent = cache.get_most_recent()
+        assert most_recent is not None
+        assert most_recent.address == ADDR_B
+
+    def test_remove(self, cache: FurbyCache) -> None:
+        cache.add_or_update(ADDR_A)
+        assert cache.remove(ADDR_A) is True
+        assert cache.get(ADDR_A) is None
+
+    def test_remove_unknown(self, cache: FurbyCache) -> None:
+        assert cache.remove(ADDR_A) is False
+
+    def test_clear(self, cache: FurbyCache) -> None:
+        cache.add_or_update(ADDR_A)
+        cache.add_or_update(ADDR_B)
+        cache.clear()
+        assert cache.get_all() == []
+
+
+class TestBatching:
+    def test_batched_updates_write_once(self, cache: FurbyCache) -> None:
+        """Updates inside a `with cache:` block coalesce into one write."""
+        writes = 0
+        original_write = cache._write
+
+        def counting_write() -> None:
+            nonlocal writes
+            writes += 1
+            original_write()
+
+        cache._write = counting_write  # type: ignore[method-assign]
+
+        with cache:
+            cache.add_or_update(ADDR_A)
+            cache.add_or_update(ADDR_B)
+            cache.add_or_update(ADDR_C)
+
+        assert writes == 1
+        assert len(FurbyCache(cache.cache_file).get_all()) == 3
+
+    def test_unchanged_reseen_skips_write(self, cache: FurbyCache) -> None:
+        """Re-seeing a device with identical data doesn't rewrite the file."""
+        cache.add_or_update(ADDR_A, device_name="Furby")
+        writes = 0
+
+        def counting_write() -> None:
+            nonlocal writes
+            writes += 1
+
+        cache._write = counting_write  # type: ignore[method-assign]
+        result = cache.add_or_update(ADDR_A, device_name="Furby")
+
+        assert writes == 0
+        assert result.device_name == "Furby"
+
+    def test_reseen_last_seen_persists_after_interval(self, cache_path: Path) -> None:
+        """Refreshes are throttled against the last persisted timestamp."""
+        cache = FurbyCache(cache_path, clock=count(1.0).__next__)
+        cache.add_or_update(ADDR_A)  # t=1.0, written
+        writes = 0
+        original_write = cache._write
+
+        def counting_write() -> None:
+            nonlocal writes
+            writes += 1
+            original_write()
+
+        cache._write = counting_write  # type: ignore[method-assign]
+
+        # t=2..5 are all within LAST_SEEN_SAVE_INTERVAL of the persisted
+        # t=1, so they only refresh in memory
+        for _ in range(4):
+            cache.add_or_update(ADDR_A)
+        assert writes == 0
+
+        # t=6 is a full interval past the persisted value and must write
+        cache.add_or_update(ADDR_A)
+        assert writes == 1
+        furby = FurbyCache(cache_path).get(ADDR_A)
+        assert furby is not None
+        assert furby.last_seen == 6.0
+
+    def test_flush_persists_throttled_refresh(self, cache_path: Path) -> None:
+        """A throttled last_seen refresh is still written by flush()."""
+        cache = FurbyCache(cache_path, clock=count(1.0).__next__)
+        cache.add_or_update(ADDR_A)  # t=1.0, written
+        cache.add_or_update(ADDR_A)  # t=2.0, throttled to memory only
+        cache.flush()
+        furby = FurbyCache(cache_path).get(ADDR_A)
+        assert furby is not None
+        assert furby.last_seen == 2.0
+
+    def test_flush_without_changes_is_noop(self, cache: FurbyCache) -> None:
+        cache.flush()
+        assert not cache.cache_file.exists()
+
+
+class TestPersistence:
+    def test_save_and_load_cache(self, cache: FurbyCache) -> None:
+        cache.add_or_update(ADDR_A, device_name="Furby", name="Ah-Koh", name_id=3)
+
+        reloaded = FurbyCache(cache.cache_file)
+        furby = reloaded.get(ADDR_A)
+        assert furby is not None
+        assert furby.device_name == "Furby"
+        assert furby.name == "Ah-Koh"
+        assert furby.name_id == 3
+
+    def test_save_with_multiple_furbies(self, cache: FurbyCache) -> None:
+        cache.add_or_update(ADDR_A)
+        cache.add_or_update(ADDR_B)
+        cache.add_or_update(ADDR_C)
+
+        # The file on disk is plain JSON readable by stdlib
+        with open(cache.cache_file) as f:
+            data = json.load(f)
+        assert "furbies" in data
+        assert set(data["furbies"]) == {ADDR_A, ADDR_B, ADDR_C}
+
+    def test_cache_file_in_subdirectory(self, cache_path: Path) -> None:
+        cache_file = cache_path.parent / "config" / "deep" / cache_path.name
+        cache = FurbyCache(cache_file)
+        cache.add_or_update(ADDR_A)
+        assert cache_file.exists()
+
+    def test_load_corrupted_cache(self, cache_path: Path) -> None:
+        cache_path.write_text("{not valid json")
+        cache = FurbyCache(cache_path)
+        assert cache.get_all() == []
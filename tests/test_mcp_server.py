@@ -7,23 +7,30 @@ and can be imported without errors.
 
 import pytest
 
+pytest.importorskip("mcp")
+
+from pyfluff.mcp_server import (  # noqa: E402
+    get_connection_status,
+    list_common_actions,
+    mcp,
+)
+
+
+@pytest.fixture(scope="module")
+def tool_names() -> list[str]:
+    """Registered tool names, resolved once for the module."""
+    return [tool.name for tool in mcp._tool_manager._tools.values()]
+
 
 def test_mcp_server_import():
     """Test that MCP server can be imported."""
-    from pyfluff.mcp_server import mcp
-
     assert mcp is not None
     assert mcp.name == "PyFluff Furby Controller"
 
 
-def test_mcp_server_has_tools():
+def test_mcp_server_has_tools(tool_names):
     """Test that all expected tools are registered."""
-    from pyfluff.mcp_server import mcp
-
-    # Get the list of registered tools
-    tool_names = [tool.name for tool in mcp._tool_manager._tools.values()]
-
-    expected_tools = [
+    expected_tools = {
         "discover_furbies",
         "connect_furby",
         "disconnect_furby",
@@ -34,16 +41,14 @@ def test_mcp_server_has_tools():
         "set_lcd_backlight",
         "cycle_debug_menu",
         "list_common_actions",
-    ]
+    }
 
-    for tool in expected_tools:
-        assert tool in tool_names, f"Tool '{tool}' not found in registered tools"
+    missing = expected_tools - set(tool_names)
+    assert not missing, f"Missing tools: {missing}"
 
 
 def test_list_common_actions():
     """Test that list_common_actions returns expected data."""
-    from pyfluff.mcp_server import list_common_actions
-
     result = list_common_actions()
 
     assert result["success"] is True
@@ -62,8 +67,6 @@ def test_list_common_actions():
 @pytest.mark.asyncio
 async def test_get_connection_status():
     """Test get_connection_status returns proper structure."""
-    from pyfluff.mcp_server import get_connection_status
-
     result = await get_connection_status()
 
     assert "connected" in result
@@ -74,8 +77,6 @@ async def test_get_connection_status():
 
 def test_mcp_server_instructions():
     """Test that MCP server has proper instructions."""
-    from pyfluff.mcp_server import mcp
-
     assert mcp.instructions is not None
     assert "Furby Connect" in mcp.instructions
     assert "Bluetooth" in mcp.instructions